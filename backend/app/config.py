@@ -12,6 +12,10 @@ class Settings(BaseSettings):
     MYSQL_USER: str = "root"
     MYSQL_PASSWORD: str = ""
     MYSQL_DATABASE: str = "newsletter_db"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 10
+    DB_POOL_RECYCLE: int = 3600
     
     # Redis
     REDIS_HOST: str = "localhost"
@@ -25,6 +29,7 @@ class Settings(BaseSettings):
     SERPER_API_KEY: str = ""
     RESEND_API_KEY: str = ""
     GOOGLE_FACT_CHECK_API_KEY: str = ""
+    RESEND_GZIP_REQUESTS: bool = False  # Opt-in: gzip request bodies are unverified against Resend
     
     # AWS S3
     AWS_ACCESS_KEY_ID: str = ""
@@ -39,9 +44,14 @@ class Settings(BaseSettings):
     API_PORT: int = 8000
     
     # FAISS
-    FAISS_INDEX_PATH: str = "./data/faiss_index.pkl"
+    FAISS_INDEX_PATH: str = "./data/faiss_index.index"
     FAISS_DIMENSION: int = 384
     FAISS_TOP_K: int = 5
+    FAISS_HNSW_THRESHOLD: int = 10000
+    FAISS_HNSW_M: int = 32
+    FAISS_HNSW_EF_CONSTRUCTION: int = 200
+    FAISS_HNSW_EF_SEARCH: int = 64
+    EMBEDDING_INT8_CPU: bool = True
     
     # Cache
     CACHE_TTL: int = 3600
@@ -51,6 +61,11 @@ class Settings(BaseSettings):
         """Get MySQL database URL."""
         return f"mysql+pymysql://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}@{self.MYSQL_HOST}:{self.MYSQL_PORT}/{self.MYSQL_DATABASE}"
     
+    @property
+    def async_database_url(self) -> str:
+        """Get MySQL database URL for the asyncio (aiomysql) driver."""
+        return f"mysql+aiomysql://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}@{self.MYSQL_HOST}:{self.MYSQL_PORT}/{self.MYSQL_DATABASE}"
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
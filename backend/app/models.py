@@ -1,9 +1,11 @@
 """Database models for the Newsletter AI application."""
-from sqlalchemy import Column, Integer, String, Text, Float, TIMESTAMP, Enum, ForeignKey, LargeBinary, CheckConstraint
+from sqlalchemy import Column, Integer, String, Text, Float, TIMESTAMP, Enum, ForeignKey, LargeBinary, CheckConstraint, UniqueConstraint, Index
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy.types import TypeDecorator
 from app.database import Base
 import enum
+import orjson
 
 
 class SubscriptionStatus(str, enum.Enum):
@@ -19,13 +21,25 @@ class ReadingLevel(str, enum.Enum):
     EXPERT = "expert"
 
 
+class JSONText(TypeDecorator):
+    """JSON value stored in a TEXT column, decoded once when the row is loaded."""
+    impl = Text
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        return orjson.dumps(value).decode() if value is not None else None
+    
+    def process_result_value(self, value, dialect):
+        return orjson.loads(value) if value is not None else None
+
+
 class User(Base):
     """User model."""
     __tablename__ = "users"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
-    interests = Column(Text, nullable=False)  # JSON stored as text
+    interests = Column(JSONText, nullable=False)  # JSON list stored as text
     reading_level = Column(Enum(ReadingLevel), nullable=False)
     subscription_status = Column(Enum(SubscriptionStatus), default=SubscriptionStatus.FREE)
     created_at = Column(TIMESTAMP, server_default=func.current_timestamp())
@@ -48,9 +62,14 @@ class Article(Base):
     fact_check_status = Column(String(20), default=None)
     bias_explanation = Column(Text, default=None)
     deep_dive_content = Column(Text, default=None)
-    embedding_id = Column(Integer, ForeignKey("faiss_embeddings.id"))
+    embedding_id = Column(Integer, ForeignKey("faiss_embeddings.id"))  # Legacy; FAISSEmbedding.article_id is authoritative
     created_at = Column(TIMESTAMP, server_default=func.current_timestamp())
     
+    # Serves "most recent articles" queries without a filesort
+    __table_args__ = (
+        Index("ix_articles_created_at_desc", created_at.desc()),
+    )
+    
     # Relationships
     embedding = relationship("FAISSEmbedding", back_populates="article", uselist=False, foreign_keys="[FAISSEmbedding.article_id]")
     feedback = relationship("UserFeedback", back_populates="article")
@@ -61,7 +80,7 @@ class FAISSEmbedding(Base):
     __tablename__ = "faiss_embeddings"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    embedding_vector = Column(LargeBinary, nullable=False)  # Serialized embedding
+    embedding_vector = deferred(Column(LargeBinary, nullable=False))  # Serialized embedding, loaded on access
     article_id = Column(Integer, ForeignKey("articles.id"), unique=True, nullable=False)
     
     # Relationships
@@ -71,6 +90,9 @@ class FAISSEmbedding(Base):
 class UserFeedback(Base):
     """User feedback model."""
     __tablename__ = "user_feedback"
+    __table_args__ = (
+        UniqueConstraint("user_id", "article_id", name="uq_feedback_user_article"),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -1,11 +1,18 @@
 """API routes for the Newsletter AI application."""
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import bindparam, exists, func, insert, lambda_stmt, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+import httpx
 import json
+import os
+import orjson
 from loguru import logger
 
-from app.database import get_db
+from app.config import get_settings
+from app.database import get_async_db
 from app.schemas import (
     UserCreate, UserResponse, UserLogin,
     SearchRequest, SearchResponse,
@@ -17,14 +24,136 @@ from app.models import User, Article, FAISSEmbedding, UserFeedback
 from app.services.faiss_service import faiss_service
 from app.services.groq_service import groq_service
 from app.services.redis_service import redis_service
-from app.services.serper_service import serper_service
-from app.services.resend_service import resend_service
+from app.services.serper_service import get_serper_service
+from app.services.resend_service import get_resend_service
+from app.services.user_cache import CachedUser, get_cached_user, invalidate_user
+
+settings = get_settings()
 
 router = APIRouter()
 
+# Columns served by the read endpoints that return plain dicts
+_ARTICLE_RESPONSE_COLUMNS = (
+    Article.id,
+    Article.title,
+    Article.url,
+    Article.summary,
+    Article.source,
+    Article.bias_score
+)
+
+# Hot short selects, built once and reused from the lambda statement cache
+_get_user_by_email = lambda_stmt(lambda: select(User).where(User.email == bindparam("email")))
+_get_article_by_url = lambda_stmt(lambda: select(Article).where(Article.url == bindparam("url")))
+_get_article_by_id = lambda_stmt(
+    lambda: select(
+        Article.id,
+        Article.title,
+        Article.url,
+        Article.summary,
+        Article.source,
+        Article.bias_score
+    ).where(Article.id == bindparam("article_id"))
+)
+
+
+def get_http_client(request: Request) -> Optional[httpx.AsyncClient]:
+    """
+    App-scoped outbound HTTP client created in main.py's lifespan.
+    
+    Args:
+        request: Incoming request
+        
+    Returns:
+        Shared client, or None when the app did not create one
+    """
+    return getattr(request.app.state, "http", None)
+
+
+# Request-scoped validators. FastAPI resolves each dependency once per request,
+# so routes and nested dependencies share both the session and the lookup.
+async def valid_user(user_id: int, db: AsyncSession = Depends(get_async_db)) -> CachedUser:
+    """
+    Resolve the user_id query parameter to a user or raise 404.
+    
+    Args:
+        user_id: User ID
+        db: Database session
+        
+    Returns:
+        Cached user snapshot
+    """
+    user = await get_cached_user(db, user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    return user
+
+
+async def optional_user(
+    user_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db)
+) -> Optional[CachedUser]:
+    """
+    Like valid_user, but returns None when no user_id was given.
+    
+    Args:
+        user_id: User ID (optional)
+        db: Database session
+        
+    Returns:
+        Cached user snapshot or None
+    """
+    if not user_id:
+        return None
+    return await valid_user(user_id, db)
+
 
-@router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
+async def valid_feedback(
+    feedback_data: FeedbackCreate,
+    db: AsyncSession = Depends(get_async_db)
+) -> FeedbackCreate:
+    """
+    Check that the feedback's user and article exist, in one round-trip.
+    
+    Args:
+        feedback_data: User feedback data
+        db: Database session
+        
+    Returns:
+        The validated feedback data
+    """
+    checks = (
+        await db.execute(
+            select(
+                exists().where(User.id == feedback_data.user_id).label("user_exists"),
+                exists().where(Article.id == feedback_data.article_id).label("article_exists")
+            )
+        )
+    ).one()
+    
+    if not checks.user_exists:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    
+    if not checks.article_exists:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Article not found"
+        )
+    return feedback_data
+
+
+@router.post(
+    "/signup",
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_201_CREATED: {"model": UserResponse}}
+)
+async def signup(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Create a new user account.
     
@@ -37,7 +166,9 @@ async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
     """
     try:
         # Check if user already exists
-        existing_user = db.query(User).filter(User.email == user_data.email).first()
+        existing_user = (
+            await db.execute(_get_user_by_email, {"email": user_data.email})
+        ).scalar_one_or_none()
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -47,21 +178,22 @@ async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
         # Create new user
         new_user = User(
             email=user_data.email,
-            interests=json.dumps(user_data.interests),
+            interests=user_data.interests,
             reading_level=user_data.reading_level
         )
         
         db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
+        await db.commit()
+        await db.refresh(new_user)
+        invalidate_user(new_user.id)
         
         logger.info(f"New user created: {new_user.email}")
         
         # Format response
-        response = UserResponse(
+        response = UserResponse.model_construct(
             id=new_user.id,
             email=new_user.email,
-            interests=json.loads(new_user.interests),
+            interests=new_user.interests,
             reading_level=new_user.reading_level.value,
             subscription_status=new_user.subscription_status.value
         )
@@ -72,15 +204,15 @@ async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
         raise
     except Exception as e:
         logger.error(f"Failed to create user: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create user: {str(e)}"
         )
 
 
-@router.post("/login", response_model=UserResponse)
-async def login(user_data: UserLogin, db: Session = Depends(get_db)):
+@router.post("/login", responses={status.HTTP_200_OK: {"model": UserResponse}})
+async def login(user_data: UserLogin, db: AsyncSession = Depends(get_async_db)):
     """
     Login an existing user.
     
@@ -93,7 +225,9 @@ async def login(user_data: UserLogin, db: Session = Depends(get_db)):
     """
     try:
         # Find user by email
-        user = db.query(User).filter(User.email == user_data.email).first()
+        user = (
+            await db.execute(_get_user_by_email, {"email": user_data.email})
+        ).scalar_one_or_none()
         
         if not user:
             raise HTTPException(
@@ -104,10 +238,10 @@ async def login(user_data: UserLogin, db: Session = Depends(get_db)):
         logger.info(f"User logged in: {user.email}")
         
         # Format response
-        response = UserResponse(
+        response = UserResponse.model_construct(
             id=user.id,
             email=user.email,
-            interests=json.loads(user.interests),
+            interests=user.interests,
             reading_level=user.reading_level.value,
             subscription_status=user.subscription_status.value
         )
@@ -124,10 +258,10 @@ async def login(user_data: UserLogin, db: Session = Depends(get_db)):
         )
 
 
-@router.post("/search_articles", response_model=SearchResponse)
+@router.post("/search_articles", responses={status.HTTP_200_OK: {"model": SearchResponse}})
 async def search_articles(
     search_data: SearchRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Search for articles using semantic similarity (FAISS).
@@ -149,61 +283,50 @@ async def search_articles(
         )
         
         # Try to get from cache
-        cached_result = redis_service.get(cache_key)
+        cached_result = redis_service.get_raw(cache_key)
         if cached_result:
             logger.info(f"Returning cached search results for query: {search_data.query}")
-            return SearchResponse(**cached_result)
+            return Response(content=cached_result, media_type="application/json")
         
         # Perform FAISS search
-        search_results = faiss_service.search(search_data.query, top_k=search_data.top_k)
+        search_results = await run_in_threadpool(
+            faiss_service.search, search_data.query, top_k=search_data.top_k
+        )
         
         if not search_results:
-            return SearchResponse(
-                articles=[],
-                query=search_data.query,
-                total_results=0
-            )
+            return {
+                "articles": [],
+                "query": search_data.query,
+                "total_results": 0
+            }
         
         # Get article IDs
         article_ids = [article_id for article_id, _ in search_results]
         
-        # Fetch articles from database
-        articles = db.query(Article).filter(Article.id.in_(article_ids)).all()
-        
-        # Create article lookup
-        article_lookup = {article.id: article for article in articles}
-        
-        # Sort articles by FAISS ranking
-        sorted_articles = []
-        for article_id, distance in search_results:
-            if article_id in article_lookup:
-                sorted_articles.append(article_lookup[article_id])
+        # Fetch only the columns the response needs
+        rows = await db.execute(
+            select(*_ARTICLE_RESPONSE_COLUMNS).where(Article.id.in_(article_ids))
+        )
         
-        # Format response
+        # Build response dicts straight from the row mappings, then order by FAISS rank
+        article_lookup = {row["id"]: dict(row) for row in rows.mappings()}
         article_responses = [
-            ArticleResponse(
-                id=article.id,
-                title=article.title,
-                url=article.url,
-                summary=article.summary,
-                source=article.source,
-                bias_score=article.bias_score
-            )
-            for article in sorted_articles
+            article_lookup[article_id] for article_id in article_ids if article_id in article_lookup
         ]
         
-        response = SearchResponse(
-            articles=article_responses,
-            query=search_data.query,
-            total_results=len(article_responses)
-        )
+        response = {
+            "articles": article_responses,
+            "query": search_data.query,
+            "total_results": len(article_responses)
+        }
         
-        # Cache the result
-        redis_service.set(cache_key, response.model_dump(), ttl=3600)
+        # Serialize once for both the cache and the response body
+        payload = orjson.dumps(response)
+        redis_service.set_raw(cache_key, payload, ttl=3600)
         
         logger.info(f"Found {len(article_responses)} articles for query: {search_data.query}")
         
-        return response
+        return Response(content=payload, media_type="application/json")
         
     except Exception as e:
         logger.error(f"Failed to search articles: {e}")
@@ -216,7 +339,7 @@ async def search_articles(
 @router.post("/summarize", response_model=SummarizeResponse)
 async def summarize_article(
     summarize_data: SummarizeRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Summarize an article using Groq API.
@@ -230,11 +353,19 @@ async def summarize_article(
     """
     try:
         # Check if article already exists and has summary
-        existing_article = db.query(Article).filter(Article.url == summarize_data.article_url).first()
+        existing_article = (
+            await db.execute(_get_article_by_url, {"url": summarize_data.article_url})
+        ).scalar_one_or_none()
         
         if existing_article and existing_article.summary:
-            summary_points = json.loads(existing_article.summary)
-            word_count = sum(len(point.split()) for point in summary_points)
+            stored_summary = json.loads(existing_article.summary)
+            if isinstance(stored_summary, dict):
+                summary_points = stored_summary["points"]
+                word_count = stored_summary["word_count"]
+            else:
+                # Summaries stored before word_count was persisted
+                summary_points = stored_summary
+                word_count = sum(len(point.split()) for point in summary_points)
             
             logger.info(f"Returning cached summary for: {summarize_data.article_url}")
             
@@ -245,15 +376,18 @@ async def summarize_article(
             )
         
         # Generate new summary
-        summary_result = groq_service.summarize_from_url(
+        summary_result = await groq_service.summarize_from_url_async(
             url=summarize_data.article_url,
             reading_level=summarize_data.reading_level.value
         )
         
         # Update or create article with summary
         if existing_article:
-            existing_article.summary = json.dumps(summary_result['summary'])
-            db.commit()
+            existing_article.summary = json.dumps({
+                "points": summary_result['summary'],
+                "word_count": summary_result['word_count']
+            })
+            await db.commit()
             logger.info(f"Updated summary for existing article: {summarize_data.article_url}")
         
         response = SummarizeResponse(
@@ -277,95 +411,66 @@ async def summarize_article(
         )
 
 
-@router.post("/feedback", response_model=FeedbackResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/feedback",
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_201_CREATED: {"model": FeedbackResponse}}
+)
 async def submit_feedback(
-    feedback_data: FeedbackCreate,
-    db: Session = Depends(get_db)
+    feedback_data: FeedbackCreate = Depends(valid_feedback),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Submit user feedback/rating for an article.
     
     Args:
-        feedback_data: User feedback data
+        feedback_data: User feedback data, already checked by valid_feedback
         db: Database session
         
     Returns:
         Created feedback object
     """
     try:
-        # Verify user exists
-        user = db.query(User).filter(User.id == feedback_data.user_id).first()
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found"
-            )
-        
-        # Verify article exists
-        article = db.query(Article).filter(Article.id == feedback_data.article_id).first()
-        if not article:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Article not found"
-            )
-        
-        # Check if feedback already exists
-        existing_feedback = db.query(UserFeedback).filter(
-            UserFeedback.user_id == feedback_data.user_id,
-            UserFeedback.article_id == feedback_data.article_id
-        ).first()
-        
-        if existing_feedback:
-            # Update existing feedback
-            existing_feedback.rating = feedback_data.rating
-            db.commit()
-            db.refresh(existing_feedback)
-            
-            logger.info(f"Updated feedback for user {feedback_data.user_id}, article {feedback_data.article_id}")
-            
-            return FeedbackResponse(
-                id=existing_feedback.id,
-                user_id=existing_feedback.user_id,
-                article_id=existing_feedback.article_id,
-                rating=existing_feedback.rating
-            )
-        
-        # Create new feedback
-        new_feedback = UserFeedback(
+        # Insert or update the rating atomically; LAST_INSERT_ID(id) makes
+        # lastrowid report the existing row's id when the key already exists
+        upsert = mysql_insert(UserFeedback).values(
             user_id=feedback_data.user_id,
             article_id=feedback_data.article_id,
             rating=feedback_data.rating
         )
+        result = await db.execute(
+            upsert.on_duplicate_key_update(
+                rating=upsert.inserted.rating,
+                id=func.last_insert_id(UserFeedback.id)
+            )
+        )
+        await db.commit()
         
-        db.add(new_feedback)
-        db.commit()
-        db.refresh(new_feedback)
-        
-        logger.info(f"New feedback created for user {feedback_data.user_id}, article {feedback_data.article_id}")
+        logger.info(f"Saved feedback for user {feedback_data.user_id}, article {feedback_data.article_id}")
         
         # Clear recommendation cache for this user
         redis_service.clear_pattern(f"recommend:user_id:{feedback_data.user_id}:*")
         
-        return FeedbackResponse(
-            id=new_feedback.id,
-            user_id=new_feedback.user_id,
-            article_id=new_feedback.article_id,
-            rating=new_feedback.rating
+        return FeedbackResponse.model_construct(
+            id=result.lastrowid,
+            user_id=feedback_data.user_id,
+            article_id=feedback_data.article_id,
+            rating=feedback_data.rating
         )
         
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Failed to submit feedback: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to submit feedback: {str(e)}"
         )
 
 
-@router.get("/articles/{article_id}", response_model=ArticleResponse)
-async def get_article(article_id: int, db: Session = Depends(get_db)):
+@router.get("/articles/{article_id}", responses={status.HTTP_200_OK: {"model": ArticleResponse}})
+async def get_article(article_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Get article by ID.
     
@@ -377,7 +482,9 @@ async def get_article(article_id: int, db: Session = Depends(get_db)):
         Article object
     """
     try:
-        article = db.query(Article).filter(Article.id == article_id).first()
+        article = (
+            await db.execute(_get_article_by_id, {"article_id": article_id})
+        ).mappings().first()
         
         if not article:
             raise HTTPException(
@@ -385,14 +492,7 @@ async def get_article(article_id: int, db: Session = Depends(get_db)):
                 detail="Article not found"
             )
         
-        return ArticleResponse(
-            id=article.id,
-            title=article.title,
-            url=article.url,
-            summary=article.summary,
-            source=article.source,
-            bias_score=article.bias_score
-        )
+        return dict(article)
         
     except HTTPException:
         raise
@@ -418,9 +518,10 @@ async def health_check():
 @router.get("/fetch_news")
 async def fetch_news(
     query: str = None,
-    user_id: int = None,
     limit: int = 10,
-    db: Session = Depends(get_db)
+    user: Optional[CachedUser] = Depends(optional_user),
+    db: AsyncSession = Depends(get_async_db),
+    http: Optional[httpx.AsyncClient] = Depends(get_http_client)
 ):
     """
     Fetch news articles using Serper API.
@@ -428,9 +529,10 @@ async def fetch_news(
     
     Args:
         query: Search query (optional)
-        user_id: User ID to fetch personalized news (optional)
         limit: Number of articles to fetch
+        user: User resolved from the user_id query parameter (optional)
         db: Database session
+        http: Shared outbound HTTP client
         
     Returns:
         List of news articles
@@ -438,57 +540,47 @@ async def fetch_news(
     try:
         articles_data = []
         
-        if user_id:
-            # Fetch user interests
-            user = db.query(User).filter(User.id == user_id).first()
-            if not user:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="User not found"
-                )
-            
-            interests = json.loads(user.interests)
+        if user:
+            interests = user.interests
             articles_per_interest = max(1, limit // len(interests))
-            articles_data = serper_service.fetch_news_by_interests(interests, articles_per_interest)
+            articles_data = await get_serper_service().fetch_news_by_interests(interests, articles_per_interest, client=http)
         elif query:
             # Fetch by query
-            articles_data = serper_service.fetch_news(query, limit)
+            articles_data = await get_serper_service().fetch_news(query, limit, client=http)
         else:
             # Fetch general tech news
-            articles_data = serper_service.fetch_news("technology news", limit)
+            articles_data = await get_serper_service().fetch_news("technology news", limit, client=http)
         
         # Store articles in database (avoid duplicates)
-        stored_articles = []
+        urls = list(dict.fromkeys(article_data["url"] for article_data in articles_data))
+        existing_urls = set(
+            (await db.scalars(select(Article.url).where(Article.url.in_(urls)))).all()
+        ) if urls else set()
+        
+        new_articles = []
         for article_data in articles_data:
-            # Check if article exists
-            existing = db.query(Article).filter(Article.url == article_data["url"]).first()
-            
-            if not existing:
-                new_article = Article(
-                    title=article_data["title"],
-                    url=article_data["url"],
-                    content=article_data["content"],
-                    source=article_data["source"]
-                )
-                db.add(new_article)
-                db.commit()
-                db.refresh(new_article)
-                stored_articles.append(new_article)
-            else:
-                stored_articles.append(existing)
-        
-        # Convert to response format
-        response_articles = [
-            ArticleResponse(
-                id=article.id,
-                title=article.title,
-                url=article.url,
-                summary=article.summary,
-                source=article.source,
-                bias_score=article.bias_score
-            )
-            for article in stored_articles
-        ]
+            if article_data["url"] in existing_urls:
+                continue
+            existing_urls.add(article_data["url"])
+            new_articles.append({
+                "title": article_data["title"],
+                "url": article_data["url"],
+                "content": article_data["content"],
+                "source": article_data["source"]
+            })
+        
+        if new_articles:
+            await db.execute(insert(Article), new_articles)
+            await db.commit()
+        
+        # Load stored rows in one query, preserving the fetch order
+        articles_by_url = {
+            row["url"]: dict(row)
+            for row in (
+                await db.execute(select(*_ARTICLE_RESPONSE_COLUMNS).where(Article.url.in_(urls)))
+            ).mappings()
+        } if urls else {}
+        response_articles = [articles_by_url[url] for url in urls if url in articles_by_url]
         
         logger.info(f"Fetched and stored {len(response_articles)} articles")
         
@@ -510,7 +602,7 @@ async def fetch_news(
 @router.post("/generate_embeddings")
 async def generate_embeddings_endpoint(
     article_ids: List[int] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Generate FAISS embeddings for articles.
@@ -525,10 +617,12 @@ async def generate_embeddings_endpoint(
     try:
         # Get articles without embeddings
         if article_ids:
-            articles = db.query(Article).filter(Article.id.in_(article_ids)).all()
+            articles = (await db.scalars(select(Article).where(Article.id.in_(article_ids)))).all()
         else:
-            articles = db.query(Article).outerjoin(FAISSEmbedding).filter(
-                FAISSEmbedding.id == None
+            articles = (
+                await db.scalars(
+                    select(Article).outerjoin(FAISSEmbedding).where(FAISSEmbedding.id == None)
+                )
             ).all()
         
         if not articles:
@@ -542,29 +636,25 @@ async def generate_embeddings_endpoint(
         texts = [article.content for article in articles]
         article_id_list = [article.id for article in articles]
         
-        embeddings = faiss_service.generate_embeddings_batch(texts)
-        faiss_service.add_embeddings(embeddings, article_id_list)
+        embeddings = await run_in_threadpool(faiss_service.generate_embeddings_batch, texts)
         
-        # Store in database
-        for i, article in enumerate(articles):
-            embedding_bytes = embeddings[i].tobytes()
-            
-            faiss_embedding = FAISSEmbedding(
-                embedding_vector=embedding_bytes,
-                article_id=article.id
-            )
-            
-            db.add(faiss_embedding)
-            db.commit()
-            db.refresh(faiss_embedding)
-            
-            article.embedding_id = faiss_embedding.id
-            db.commit()
+        # Store in database: one executemany INSERT, one commit
+        await db.execute(
+            insert(FAISSEmbedding),
+            [
+                {"embedding_vector": faiss_service.pack_embedding(embeddings[i]), "article_id": article.id}
+                for i, article in enumerate(articles)
+            ]
+        )
+        await db.commit()
+        
+        # Index only after the rows are stored; off the event loop, since the
+        # batch that crosses FAISS_HNSW_THRESHOLD rebuilds the index as HNSW
+        await run_in_threadpool(faiss_service.add_embeddings, embeddings, article_id_list)
         
         # Save FAISS index
-        import os
         os.makedirs(os.path.dirname(settings.FAISS_INDEX_PATH), exist_ok=True)
-        faiss_service.save_index(settings.FAISS_INDEX_PATH)
+        await run_in_threadpool(faiss_service.save_index, settings.FAISS_INDEX_PATH)
         
         logger.info(f"Generated embeddings for {len(articles)} articles")
         
@@ -577,7 +667,7 @@ async def generate_embeddings_endpoint(
         
     except Exception as e:
         logger.error(f"Failed to generate embeddings: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to generate embeddings: {str(e)}"
@@ -586,38 +676,40 @@ async def generate_embeddings_endpoint(
 
 @router.post("/send_email")
 async def send_newsletter_email(
-    user_id: int,
     article_ids: List[int] = None,
     subject: str = "Your AI-Curated Newsletter",
-    db: Session = Depends(get_db)
+    user: CachedUser = Depends(valid_user),
+    db: AsyncSession = Depends(get_async_db),
+    http: Optional[httpx.AsyncClient] = Depends(get_http_client)
 ):
     """
     Send newsletter email to user.
     
     Args:
-        user_id: User ID
         article_ids: List of article IDs to include (optional, uses recent if None)
         subject: Email subject
+        user: User resolved from the user_id query parameter
         db: Database session
+        http: Shared outbound HTTP client
         
     Returns:
         Email send status
     """
     try:
-        # Get user
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found"
-            )
-        
-        # Get articles
+        # Get articles, shipping only the first 200 characters of content
+        article_query = select(
+            Article.title,
+            Article.url,
+            Article.summary,
+            func.substr(Article.content, 1, 200).label("snippet"),
+            Article.source
+        )
         if article_ids:
-            articles = db.query(Article).filter(Article.id.in_(article_ids)).all()
+            article_query = article_query.where(Article.id.in_(article_ids))
         else:
             # Get recent articles
-            articles = db.query(Article).order_by(Article.created_at.desc()).limit(5).all()
+            article_query = article_query.order_by(Article.created_at.desc()).limit(5)
+        articles = (await db.execute(article_query)).all()
         
         if not articles:
             raise HTTPException(
@@ -630,18 +722,18 @@ async def send_newsletter_email(
             {
                 "title": article.title,
                 "url": article.url,
-                "content": article.summary if article.summary else article.content[:200] + "...",
+                "content": article.summary if article.summary else article.snippet + "...",
                 "source": article.source
             }
             for article in articles
         ]
         
         # Send email
-        success = resend_service.send_newsletter(
+        success = await get_resend_service().send_newsletter_async(
             to_email=user.email,
             subject=subject,
-            html_content=None,
-            articles=articles_data
+            articles=articles_data,
+            client=http
         )
         
         if success:
@@ -1,5 +1,5 @@
 """Pydantic schemas for request/response validation."""
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 from typing import List, Optional
 from enum import Enum
 
@@ -38,8 +38,13 @@ class UserResponse(BaseModel):
     reading_level: str
     subscription_status: str
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+    
+    @field_validator("reading_level", "subscription_status", mode="before")
+    @classmethod
+    def _enum_value(cls, value):
+        """Accept ORM enum members so a User row validates directly."""
+        return value.value if isinstance(value, Enum) else value
 
 
 # Article Schemas
@@ -63,8 +68,7 @@ class ArticleResponse(BaseModel):
     bias_explanation: Optional[str] = None
     deep_dive_content: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # Search Schemas
@@ -80,6 +84,8 @@ class SearchResponse(BaseModel):
     articles: List[ArticleResponse]
     query: str
     total_results: int
+    
+    model_config = ConfigDict(frozen=True)
 
 
 # Summarization Schemas
@@ -94,6 +100,8 @@ class SummarizeResponse(BaseModel):
     summary: List[str]
     word_count: int
     reading_level: str
+    
+    model_config = ConfigDict(frozen=True)
 
 
 # Feedback Schemas
@@ -111,8 +119,7 @@ class FeedbackResponse(BaseModel):
     article_id: int
     rating: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # Recommendation Schemas
@@ -121,6 +128,8 @@ class RecommendationResponse(BaseModel):
     user_id: int
     articles: List[ArticleResponse]
     total: int
+    
+    model_config = ConfigDict(frozen=True)
 
 
 # Fact check / bias detection schemas
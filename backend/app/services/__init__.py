@@ -2,7 +2,7 @@
 from app.services.faiss_service import faiss_service
 from app.services.groq_service import groq_service
 from app.services.redis_service import redis_service
-from app.services.serper_service import serper_service
-from app.services.resend_service import resend_service
+from app.services.serper_service import get_serper_service
+from app.services.resend_service import get_resend_service
 
-__all__ = ['faiss_service', 'groq_service', 'redis_service', 'serper_service', 'resend_service']
+__all__ = ['faiss_service', 'groq_service', 'redis_service', 'get_serper_service', 'get_resend_service']
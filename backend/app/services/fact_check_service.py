@@ -1,16 +1,64 @@
 """Fact-checking service using Google Fact Check API and heuristics."""
-import requests
-from typing import List, Dict, Optional
+import asyncio
+import hashlib
+import re
+import threading
+import httpx
+from cachetools import TTLCache
+from typing import List, Dict, Optional, Tuple
 from loguru import logger
 from app.config import get_settings
+from app.services.http_session import http_session
+from app.services.redis_service import redis_service
 
 settings = get_settings()
 
+# Sentences are pulled lazily instead of splitting the whole article
+_SENTENCE_RE = re.compile(r"[^.]+")
+_SKIP_PREFIXES = ('http', 'The', 'A ', 'An ')
+_RISKY_RE = re.compile(r"rumor|fake|unverified|conspiracy|allegedly|possibly", re.IGNORECASE)
+
+# Per-worker layer in front of Redis for claims seen repeatedly. The TTL matches
+# FactCheckService.HEURISTIC_RESULT_TTL so a fallback verdict never outlives its Redis copy.
+_claim_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+_claim_cache_lock = threading.Lock()
+
 
 class FactCheckService:
     """Service for fact-checking articles."""
     
     GOOGLE_FACT_CHECK_API = "https://factchecktools.googleapis.com/v1alpha1/checkClaim"
+    MAX_CONCURRENT_CLAIMS = 10
+    API_RESULT_TTL = 86400
+    HEURISTIC_RESULT_TTL = 3600
+    
+    def __init__(self):
+        """Initialize fact-check service."""
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared keep-alive HTTP client, created on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=5,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=300)
+            )
+        return self._client
+    
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Caps in-flight Google API calls to respect the quota."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CLAIMS)
+        return self._semaphore
+    
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     @staticmethod
     def extract_claims(text: str, max_claims: int = 3) -> List[str]:
@@ -24,18 +72,67 @@ class FactCheckService:
         Returns:
             List of potential claims
         """
+        return [claim for claim, _risky in FactCheckService._scan_claims(text, max_claims)]
+    
+    @staticmethod
+    def _scan_claims(text: str, max_claims: int) -> List[Tuple[str, bool]]:
+        """
+        Pick claims and flag uncertainty markers in the same sentence walk.
+        
+        Args:
+            text: Article text
+            max_claims: Max claims to extract
+            
+        Returns:
+            List of (claim, has_risky_words) pairs
+        """
         if not text or len(text) < 50:
             return []
         
-        # Split into sentences and pick first few as potential claims
-        sentences = text.split('.')
+        # Walk the first few sentences and keep the likely claims
         claims = []
-        for sent in sentences[:max_claims * 2]:
-            sent = sent.strip()
-            if 50 < len(sent) < 500 and not sent.startswith(('http', 'The', 'A ', 'An ')):
-                claims.append(sent)
+        for i, match in enumerate(_SENTENCE_RE.finditer(text)):
+            if i == max_claims * 2:
+                break
+            sent = match.group().strip()
+            if 50 < len(sent) < 500 and not sent.startswith(_SKIP_PREFIXES):
+                claims.append((sent, _RISKY_RE.search(sent) is not None))
+                if len(claims) == max_claims:
+                    break
         
-        return claims[:max_claims]
+        return claims
+    
+    @staticmethod
+    def _cache_key(claim: str) -> str:
+        """Stable cache key for the normalized claim text."""
+        digest = hashlib.sha256(claim.strip().lower().encode()).hexdigest()
+        return f"factcheck:{digest}"
+    
+    @staticmethod
+    def _get_cached(key: str) -> Optional[Dict]:
+        """Look a claim result up in the worker cache, then Redis."""
+        with _claim_cache_lock:
+            result = _claim_cache.get(key)
+        if result is not None:
+            return result
+        
+        result = redis_service.get(key)
+        if result is not None:
+            with _claim_cache_lock:
+                _claim_cache[key] = result
+        return result
+    
+    @staticmethod
+    def _store(key: str, result: Dict):
+        """Cache a claim result; heuristic verdicts expire sooner."""
+        ttl = (
+            FactCheckService.API_RESULT_TTL
+            if result.get("method") == "google_api"
+            else FactCheckService.HEURISTIC_RESULT_TTL
+        )
+        with _claim_cache_lock:
+            _claim_cache[key] = result
+        redis_service.set(key, result, ttl=ttl)
     
     @staticmethod
     def fact_check_claim(claim: str, api_key: Optional[str] = None) -> Dict:
@@ -49,6 +146,16 @@ class FactCheckService:
         Returns:
             Dict with fact-check status, confidence, and sources
         """
+        key = FactCheckService._cache_key(claim)
+        result = FactCheckService._get_cached(key)
+        if result is None:
+            result = FactCheckService._query_claim(claim, api_key)
+            FactCheckService._store(key, result)
+        return result
+    
+    @staticmethod
+    def _query_claim(claim: str, api_key: Optional[str] = None) -> Dict:
+        """Uncached lookup behind fact_check_claim."""
         try:
             if not api_key:
                 api_key = settings.GOOGLE_FACT_CHECK_API_KEY
@@ -62,41 +169,90 @@ class FactCheckService:
                 "key": api_key
             }
             
-            response = requests.get(
+            response = http_session.get(
                 FactCheckService.GOOGLE_FACT_CHECK_API,
                 params=params,
                 timeout=5
             )
             
             if response.status_code == 200:
-                data = response.json()
+                return FactCheckService._parse_response(response.json())
+            else:
+                logger.warning(f"Google Fact Check API error: {response.status_code}")
+                return FactCheckService._heuristic_check(claim)
                 
-                if data.get("claims"):
-                    # Get most relevant claim
-                    claim_obj = data["claims"][0]
-                    
-                    # Extract verdict
-                    verdict = "unknown"
-                    if claim_obj.get("claimReview"):
-                        for review in claim_obj["claimReview"]:
-                            if review.get("textualRating"):
-                                verdict = review["textualRating"].lower()
-                                break
-                    
-                    return {
-                        "status": "verified" if "true" in verdict else "flagged",
-                        "verdict": verdict,
-                        "sources": [r.get("publisher", {}).get("name", "Unknown") 
-                                   for r in claim_obj.get("claimReview", [])][:2],
-                        "method": "google_api"
-                    }
-                else:
-                    return {
-                        "status": "unknown",
-                        "verdict": "No fact-check data available",
-                        "sources": [],
-                        "method": "google_api"
-                    }
+        except Exception as e:
+            logger.warning(f"Fact-check API failed, using heuristic: {e}")
+            return FactCheckService._heuristic_check(claim)
+    
+    @staticmethod
+    def _parse_response(data: Dict) -> Dict:
+        """Turn a Google Fact Check API payload into a claim result."""
+        if data.get("claims"):
+            # Get most relevant claim
+            claim_obj = data["claims"][0]
+            
+            # Extract verdict
+            verdict = "unknown"
+            if claim_obj.get("claimReview"):
+                for review in claim_obj["claimReview"]:
+                    if review.get("textualRating"):
+                        verdict = review["textualRating"].lower()
+                        break
+            
+            return {
+                "status": "verified" if "true" in verdict else "flagged",
+                "verdict": verdict,
+                "sources": [r.get("publisher", {}).get("name", "Unknown") 
+                           for r in claim_obj.get("claimReview", [])][:2],
+                "method": "google_api"
+            }
+        else:
+            return {
+                "status": "unknown",
+                "verdict": "No fact-check data available",
+                "sources": [],
+                "method": "google_api"
+            }
+    
+    async def fact_check_claim_async(self, claim: str, api_key: Optional[str] = None) -> Dict:
+        """
+        Fact-check a single claim over the shared async client.
+        
+        Args:
+            claim: Claim to fact-check
+            api_key: Google API key (uses settings if not provided)
+            
+        Returns:
+            Dict with fact-check status, confidence, and sources
+        """
+        key = FactCheckService._cache_key(claim)
+        result = FactCheckService._get_cached(key)
+        if result is None:
+            result = await self._query_claim_async(claim, api_key)
+            FactCheckService._store(key, result)
+        return result
+    
+    async def _query_claim_async(self, claim: str, api_key: Optional[str] = None) -> Dict:
+        """Uncached lookup behind fact_check_claim_async."""
+        try:
+            if not api_key:
+                api_key = settings.GOOGLE_FACT_CHECK_API_KEY
+            
+            if not api_key:
+                # Fallback to heuristic if no API key
+                return FactCheckService._heuristic_check(claim)
+            
+            params = {
+                "query": claim[:500],
+                "key": api_key
+            }
+            
+            async with self.semaphore:
+                response = await self.client.get(self.GOOGLE_FACT_CHECK_API, params=params)
+            
+            if response.status_code == 200:
+                return FactCheckService._parse_response(response.json())
             else:
                 logger.warning(f"Google Fact Check API error: {response.status_code}")
                 return FactCheckService._heuristic_check(claim)
@@ -108,10 +264,12 @@ class FactCheckService:
     @staticmethod
     def _heuristic_check(claim: str) -> Dict:
         """Fallback heuristic fact-check."""
-        lowered = claim.lower()
-        risky_words = ["rumor", "fake", "unverified", "conspiracy", "allegedly", "possibly"]
-        
-        if any(word in lowered for word in risky_words):
+        return FactCheckService._heuristic_result(_RISKY_RE.search(claim) is not None)
+    
+    @staticmethod
+    def _heuristic_result(risky: bool) -> Dict:
+        """Heuristic verdict for a claim already scanned for risky words."""
+        if risky:
             return {
                 "status": "flagged",
                 "verdict": "Contains uncertainty markers",
@@ -126,8 +284,7 @@ class FactCheckService:
             "method": "heuristic"
         }
     
-    @staticmethod
-    def check_article(article_text: str) -> Dict:
+    async def check_article(self, article_text: str) -> Dict:
         """
         Fact-check an entire article by extracting and checking claims.
         
@@ -138,7 +295,8 @@ class FactCheckService:
             Dict with overall status and claim details
         """
         try:
-            claims = FactCheckService.extract_claims(article_text, max_claims=2)
+            scanned = FactCheckService._scan_claims(article_text, max_claims=2)
+            claims = [claim for claim, _risky in scanned]
             
             if not claims:
                 return {
@@ -149,12 +307,23 @@ class FactCheckService:
                     "details": []
                 }
             
+            if settings.GOOGLE_FACT_CHECK_API_KEY:
+                # Check all claims concurrently; wall time is the slowest lookup
+                gathered = await asyncio.gather(
+                    *(self.fact_check_claim_async(claim) for claim in claims),
+                    return_exceptions=True
+                )
+            else:
+                # Heuristic only: the scan already found the risky claims
+                gathered = [FactCheckService._heuristic_result(risky) for _claim, risky in scanned]
+            
             results = []
             flagged_count = 0
             verified_count = 0
             
-            for claim in claims:
-                result = FactCheckService.fact_check_claim(claim)
+            for (claim, risky), result in zip(scanned, gathered):
+                if isinstance(result, Exception):
+                    result = FactCheckService._heuristic_result(risky)
                 results.append(result)
                 
                 if result["status"] == "flagged":
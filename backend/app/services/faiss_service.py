@@ -1,8 +1,14 @@
 """FAISS vector search service for semantic article search."""
 import faiss
+import hashlib
+import lz4.frame
 import numpy as np
+import os
 import pickle
-import io
+import struct
+import threading
+from contextlib import contextmanager
+from cachetools import LRUCache
 from typing import List, Tuple, Optional
 from sentence_transformers import SentenceTransformer
 from loguru import logger
@@ -10,16 +16,29 @@ from app.config import get_settings
 
 settings = get_settings()
 
+_LZ4_FRAME_MAGIC = b"\x04\x22\x4d\x18"
+# Paths with this suffix hold a native FAISS index that can be memory-mapped
+NATIVE_INDEX_SUFFIX = ".index"
+
+# Containers can start OpenMP with a single thread; use every core for search
+faiss.omp_set_num_threads(max(1, os.cpu_count() or 1))
+
 
 class FAISSService:
     """Service for managing FAISS index and semantic search."""
     
+    ENCODE_BATCH_SIZE = 64
+    
     def __init__(self):
         """Initialize FAISS service."""
         self.model = None
         self.index = None
-        self.article_id_map = {}  # Maps FAISS index to article ID
+        self.article_ids = np.empty(0, dtype=np.int64)  # Article ID per FAISS position
         self.dimension = settings.FAISS_DIMENSION
+        # Repeated queries skip the model; keyed by SHA256 of the text
+        self._embedding_cache: LRUCache = LRUCache(maxsize=1024)
+        self._embedding_cache_lock = threading.Lock()
+        self._defer_upgrade = False  # Set while bulk_load() is active
         # Don't load model immediately - lazy load when needed
         self._initialize_index()
     
@@ -29,24 +48,87 @@ class FAISSService:
             return
             
         try:
-            logger.info("Loading sentence-transformers model: all-MiniLM-L6-v2")
-            self.model = SentenceTransformer('all-MiniLM-L6-v2')
+            import torch
+            
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            logger.info(f"Loading sentence-transformers model: all-MiniLM-L6-v2 on {device}")
+            model = SentenceTransformer('all-MiniLM-L6-v2', device=device)
+            if device == "cuda":
+                # Half precision roughly doubles GPU throughput for this model
+                model = model.half()
+            elif settings.EMBEDDING_INT8_CPU:
+                # Dynamic int8 quantization of the Linear layers uses the CPU's
+                # int8 (VNNI) kernels; weights shrink about 4x
+                model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+            self.model = model
             logger.info("Model loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
             raise
     
-    def _initialize_index(self):
-        """Initialize FAISS index."""
+    def _initialize_index(self, expected_size: int = 0):
+        """
+        Initialize FAISS index.
+        
+        Args:
+            expected_size: Number of vectors about to be added
+        """
         try:
             logger.info(f"Initializing FAISS index with dimension {self.dimension}")
-            # Using IndexFlatL2 for exact L2 distance search
-            self.index = faiss.IndexFlatL2(self.dimension)
-            logger.info("FAISS index initialized")
+            self.index = self._build_index(expected_size)
+            logger.info(
+                f"FAISS index initialized ({type(self.index).__name__}, "
+                f"{faiss.omp_get_max_threads()} threads)"
+            )
         except Exception as e:
             logger.error(f"Failed to initialize FAISS index: {e}")
             raise
     
+    def _build_index(self, expected_size: int = 0) -> faiss.Index:
+        """
+        Create an empty index sized for the corpus.
+        
+        Small corpora use an exhaustive inner-product index; once the corpus reaches
+        FAISS_HNSW_THRESHOLD vectors an HNSW graph gives sub-linear search.
+        
+        Args:
+            expected_size: Number of vectors about to be added
+            
+        Returns:
+            The new index; call train() before add() if it is not trained
+        """
+        # Vectors are L2-normalized, so inner product is cosine similarity.
+        # Codes are stored as fp16, halving memory and bytes scanned per query.
+        quantizer_type = faiss.ScalarQuantizer.QT_fp16
+        if expected_size >= settings.FAISS_HNSW_THRESHOLD:
+            # IndexHNSWSQ starts untrained on faiss 1.7.x even for fp16:
+            # callers must train() it before the first add()
+            index = faiss.IndexHNSWSQ(
+                self.dimension, quantizer_type, settings.FAISS_HNSW_M, faiss.METRIC_INNER_PRODUCT
+            )
+            index.hnsw.efConstruction = settings.FAISS_HNSW_EF_CONSTRUCTION
+            index.hnsw.efSearch = settings.FAISS_HNSW_EF_SEARCH
+            return index
+        # Exhaustive cosine search over fp16 codes; a flat fp16 SQ index needs
+        # no training, so incremental adds keep working
+        return faiss.IndexScalarQuantizer(self.dimension, quantizer_type, faiss.METRIC_INNER_PRODUCT)
+    
+    @staticmethod
+    def _normalized(vectors: np.ndarray) -> np.ndarray:
+        """Return a float32 (n, d) copy of vectors scaled to unit length."""
+        vectors = np.array(vectors, dtype=np.float32, order="C", ndmin=2)
+        faiss.normalize_L2(vectors)
+        return vectors
+    
+    def warm_up(self):
+        """Load the model and run one encode so the first request skips both."""
+        try:
+            self._load_model()
+            self.model.encode("warm up", convert_to_numpy=True)
+            logger.info("Embedding model warmed up")
+        except Exception as e:
+            logger.warning(f"Embedding model warm-up failed, will load lazily: {e}")
+    
     def generate_embedding(self, text: str) -> np.ndarray:
         """
         Generate embedding for a single text.
@@ -58,10 +140,20 @@ class FAISSService:
             Numpy array of shape (384,)
         """
         try:
+            key = hashlib.sha256(text.encode()).digest()
+            with self._embedding_cache_lock:
+                cached = self._embedding_cache.get(key)
+            if cached is not None:
+                return cached
+            
             # Lazy load model when first needed
             self._load_model()
-            embedding = self.model.encode(text, convert_to_numpy=True)
-            return embedding.astype('float32')
+            embedding = self.model.encode(text, convert_to_numpy=True, normalize_embeddings=True)
+            embedding = self._normalized(embedding)[0]
+            embedding.setflags(write=False)
+            with self._embedding_cache_lock:
+                self._embedding_cache[key] = embedding
+            return embedding
         except Exception as e:
             logger.error(f"Failed to generate embedding: {e}")
             raise
@@ -79,12 +171,63 @@ class FAISSService:
         try:
             # Lazy load model when first needed
             self._load_model()
-            embeddings = self.model.encode(texts, convert_to_numpy=True, show_progress_bar=True)
-            return embeddings.astype('float32')
+            embeddings = self.model.encode(
+                texts,
+                batch_size=self.ENCODE_BATCH_SIZE,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            )
+            return embeddings.astype('float32', copy=False)
         except Exception as e:
             logger.error(f"Failed to generate batch embeddings: {e}")
             raise
     
+    @staticmethod
+    def pack_embedding(embedding: np.ndarray) -> bytes:
+        """
+        Quantize an embedding to int8 for database storage.
+        
+        Layout is a little-endian float32 scale followed by one int8 per
+        dimension (388 bytes for 384 dims instead of 1536 as float32).
+        
+        Args:
+            embedding: Float embedding of shape (dimension,)
+            
+        Returns:
+            Packed bytes
+        """
+        embedding = np.asarray(embedding, dtype=np.float32).ravel()
+        scale = float(np.max(np.abs(embedding))) / 127.0 or 1.0
+        quantized = np.round(embedding / scale).astype(np.int8)
+        return struct.pack("<f", scale) + quantized.tobytes()
+    
+    def unpack_embedding(self, blob: bytes, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Decode a stored embedding back to float32.
+        
+        Accepts the int8 format written by pack_embedding as well as the
+        older raw float32 and pickled formats.
+        
+        Args:
+            blob: Stored embedding bytes
+            out: Optional float32 array of shape (dimension,) to decode into
+            
+        Returns:
+            Numpy array of shape (dimension,)
+        """
+        if out is None:
+            out = np.empty(self.dimension, dtype=np.float32)
+        if len(blob) == 4 + self.dimension:
+            (scale,) = struct.unpack_from("<f", blob)
+            quantized = np.frombuffer(blob, dtype=np.int8, offset=4)
+            np.multiply(quantized, np.float32(scale), out=out)
+        elif len(blob) == 4 * self.dimension:
+            out[:] = np.frombuffer(blob, dtype=np.float32)
+        else:
+            out[:] = np.asarray(pickle.loads(blob), dtype=np.float32).ravel()
+        return out
+    
     def add_embeddings(self, embeddings: np.ndarray, article_ids: List[int]):
         """
         Add embeddings to FAISS index.
@@ -97,17 +240,14 @@ class FAISSService:
             if len(embeddings) != len(article_ids):
                 raise ValueError("Number of embeddings must match number of article IDs")
             
-            # Get current index count
-            start_idx = self.index.ntotal
-            
             # Add to FAISS index
-            self.index.add(embeddings)
+            self.index.add(self._normalized(embeddings))
             
-            # Update article ID mapping
-            for i, article_id in enumerate(article_ids):
-                self.article_id_map[start_idx + i] = article_id
+            # Extend the position -> article ID array
+            self.article_ids = np.concatenate([self.article_ids, np.asarray(article_ids, dtype=np.int64)])
             
             logger.info(f"Added {len(embeddings)} embeddings to FAISS index. Total: {self.index.ntotal}")
+            self._maybe_upgrade_to_hnsw()
         except Exception as e:
             logger.error(f"Failed to add embeddings to FAISS index: {e}")
             raise
@@ -115,47 +255,152 @@ class FAISSService:
     def add_single_embedding(self, embedding: np.ndarray, article_id: int):
         """Add a single embedding to the index and map it to an article."""
         try:
-            embedding = embedding.reshape(1, -1).astype("float32")
-            start_idx = self.index.ntotal
-            self.index.add(embedding)
-            self.article_id_map[start_idx] = article_id
+            self.index.add(self._normalized(embedding))
+            self.article_ids = np.append(self.article_ids, np.int64(article_id))
             logger.info(f"Added embedding for article {article_id}. Total: {self.index.ntotal}")
+            self._maybe_upgrade_to_hnsw()
         except Exception as e:
             logger.error(f"Failed to add single embedding: {e}")
             raise
 
+    @contextmanager
+    def bulk_load(self):
+        """
+        Defer the flat -> HNSW upgrade until a series of adds is finished.
+        
+        Adds inside the block go to the append-only exhaustive index. On exit the
+        HNSW index is trained on the collected matrix and filled in one add
+        instead of being grown batch by batch.
+        """
+        self._defer_upgrade = True
+        try:
+            yield self
+        finally:
+            self._defer_upgrade = False
+        # Only convert after a clean exit so a failed ingest surfaces its own error;
+        # the next add retries the upgrade otherwise
+        self._maybe_upgrade_to_hnsw()
+    
+    def _maybe_upgrade_to_hnsw(self):
+        """Move an exhaustive index that has grown past FAISS_HNSW_THRESHOLD onto HNSW."""
+        if (
+            self._defer_upgrade
+            or hasattr(self.index, "hnsw")
+            or self.index.ntotal < settings.FAISS_HNSW_THRESHOLD
+        ):
+            return
+        # fp16 codes reconstruct losslessly enough to re-add without re-embedding
+        vectors = self.index.reconstruct_n(0, self.index.ntotal)
+        # Train and fill the graph off to the side; the live index is only
+        # replaced once the new one holds every vector
+        index = self._build_index(len(vectors))
+        if not index.is_trained:
+            index.train(vectors)
+        index.add(vectors)
+        self.index = index
+        logger.info(f"Upgraded FAISS index to HNSW at {self.index.ntotal} vectors")
+    
     def rebuild_from_embeddings(self, rows: List[Tuple[int, bytes]]):
         """Rebuild the FAISS index from stored embeddings in the database."""
         try:
-            self._initialize_index()
-            self.article_id_map = {}
+            self._initialize_index(len(rows))
+            self.article_ids = np.empty(0, dtype=np.int64)
             if not rows:
                 logger.warning("No stored embeddings found to rebuild FAISS index")
                 return
-            vectors = []
+            # Decode every blob straight into one preallocated matrix
+            matrix = np.empty((len(rows), self.dimension), dtype=np.float32)
             article_ids = []
             for article_id, blob in rows:
                 if not blob:
                     continue
                 try:
-                    vec = pickle.loads(blob)
-                    vec = np.array(vec, dtype="float32").reshape(1, -1)
-                    vectors.append(vec)
+                    self.unpack_embedding(blob, out=matrix[len(article_ids)])
                     article_ids.append(article_id)
                 except Exception as inner:
                     logger.warning(f"Skipping embedding for article {article_id}: {inner}")
-            if not vectors:
+            if not article_ids:
                 logger.warning("No valid embeddings to rebuild FAISS index")
                 return
-            matrix = np.vstack(vectors)
-            self.index.add(matrix)
-            for i, aid in enumerate(article_ids):
-                self.article_id_map[i] = aid
-            logger.info(f"Rebuilt FAISS index with {len(article_ids)} vectors")
+            self._fill_index(matrix[:len(article_ids)], article_ids)
         except Exception as e:
             logger.error(f"Failed to rebuild FAISS index: {e}")
             raise
     
+    def _fill_index(self, matrix: np.ndarray, article_ids):
+        """Normalize, train if needed and add a matrix to the freshly initialized index."""
+        faiss.normalize_L2(matrix)
+        if not self.index.is_trained:
+            self.index.train(matrix)
+        self.index.add(matrix)
+        self.article_ids = np.asarray(article_ids, dtype=np.int64)
+        logger.info(f"Rebuilt FAISS index with {len(self.article_ids)} vectors")
+    
+    def save_embeddings(self, filepath: str):
+        """
+        Save the indexed vectors as a .npy matrix, independent of the index type.
+        
+        Lets the index be rebuilt (e.g. flat -> HNSW) without re-embedding.
+        
+        Args:
+            filepath: Path of the .npy file (article IDs go to an .ids.npy sidecar)
+        """
+        try:
+            matrix = self.index.reconstruct_n(0, self.index.ntotal)
+            self._replace_atomically(filepath, lambda tmp: self._save_npy(tmp, matrix))
+            self._replace_atomically(self._ids_path(filepath), lambda tmp: self._save_npy(tmp, self.article_ids))
+            logger.info(f"Saved {len(matrix)} embeddings to {filepath}")
+        except Exception as e:
+            logger.error(f"Failed to save embeddings: {e}")
+            raise
+    
+    def load_embeddings(self, filepath: str):
+        """
+        Rebuild the index from a matrix written by save_embeddings.
+        
+        Args:
+            filepath: Path of the .npy file
+        """
+        try:
+            matrix = np.load(filepath, mmap_mode="r")
+            article_ids = np.load(self._ids_path(filepath))
+            if matrix.shape[0] != len(article_ids) or matrix.shape[1] != self.dimension:
+                raise ValueError("Embedding cache does not match its article IDs or dimension")
+            self._initialize_index(len(article_ids))
+            self._fill_index(np.array(matrix, dtype=np.float32), article_ids)
+        except Exception as e:
+            logger.error(f"Failed to load embeddings: {e}")
+            raise
+    
+    @staticmethod
+    def _save_npy(filepath: str, array: np.ndarray):
+        """np.save to an exact path (np.save would append .npy to a .tmp name)."""
+        with open(filepath, 'wb') as f:
+            np.save(f, array)
+    
+    @staticmethod
+    def _replace_atomically(filepath: str, write):
+        """Write via a temp file and os.replace so readers never see a partial file."""
+        tmp_path = filepath + ".tmp"
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, filepath)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def _to_results(self, similarities: np.ndarray, indices: np.ndarray) -> List[Tuple[int, float]]:
+        """
+        Translate one row of FAISS output into (article_id, distance) pairs.
+        
+        FAISS pads missing hits with -1; those are dropped. Distance is
+        reported as 1 - cosine similarity so smaller is closer.
+        """
+        valid = (indices >= 0) & (indices < len(self.article_ids))
+        article_ids = self.article_ids[indices[valid]].tolist()
+        distances = (1.0 - similarities[valid]).tolist()
+        return list(zip(article_ids, distances))
+    
     def search(self, query: str, top_k: int = 5) -> List[Tuple[int, float]]:
         """
         Search for similar articles using semantic similarity.
@@ -165,7 +410,7 @@ class FAISSService:
             top_k: Number of top results to return
             
         Returns:
-            List of tuples (article_id, distance)
+            List of tuples (article_id, cosine distance)
         """
         try:
             if self.index.ntotal == 0:
@@ -178,14 +423,9 @@ class FAISSService:
             
             # Search in FAISS
             top_k = min(top_k, self.index.ntotal)
-            distances, indices = self.index.search(query_embedding, top_k)
+            similarities, indices = self.index.search(query_embedding, top_k)
             
-            # Convert to article IDs
-            results = []
-            for dist, idx in zip(distances[0], indices[0]):
-                if idx in self.article_id_map:
-                    article_id = self.article_id_map[idx]
-                    results.append((article_id, float(dist)))
+            results = self._to_results(similarities[0], indices[0])
             
             logger.info(f"Found {len(results)} results for query: {query[:50]}...")
             return results
@@ -193,58 +433,131 @@ class FAISSService:
             logger.error(f"Failed to search FAISS index: {e}")
             raise
 
+    def search_batch(self, queries: List[str], top_k: int = 5) -> List[List[Tuple[int, float]]]:
+        """
+        Search for several queries with one encode and one FAISS call.
+        
+        Args:
+            queries: Search query texts
+            top_k: Number of top results per query
+            
+        Returns:
+            One list of (article_id, cosine distance) tuples per query
+        """
+        try:
+            if self.index.ntotal == 0 or not queries:
+                return [[] for _ in queries]
+            
+            query_embeddings = self.generate_embeddings_batch(queries)
+            top_k = min(top_k, self.index.ntotal)
+            similarities, indices = self.index.search(query_embeddings, top_k)
+            return [self._to_results(sims, idxs) for sims, idxs in zip(similarities, indices)]
+        except Exception as e:
+            logger.error(f"Failed to batch search FAISS index: {e}")
+            raise
+    
     def search_by_embedding(self, embedding: np.ndarray, top_k: int = 5) -> List[Tuple[int, float]]:
         """Search using a precomputed embedding."""
         try:
             if self.index.ntotal == 0:
                 logger.warning("FAISS index is empty")
                 return []
-            emb = embedding.reshape(1, -1).astype("float32")
+            emb = self._normalized(embedding)
             top_k = min(top_k, self.index.ntotal)
-            distances, indices = self.index.search(emb, top_k)
-            results = []
-            for dist, idx in zip(distances[0], indices[0]):
-                if idx in self.article_id_map:
-                    results.append((self.article_id_map[idx], float(dist)))
-            return results
+            similarities, indices = self.index.search(emb, top_k)
+            return self._to_results(similarities[0], indices[0])
         except Exception as e:
             logger.error(f"Failed to search by embedding: {e}")
             raise
     
+    def search_by_embeddings(self, embeddings: np.ndarray, top_k: int = 5) -> List[List[Tuple[int, float]]]:
+        """
+        Search several precomputed embeddings in one FAISS call.
+        
+        Args:
+            embeddings: Array of shape (n, dimension)
+            top_k: Number of top results per embedding
+            
+        Returns:
+            One list of (article_id, cosine distance) tuples per embedding
+        """
+        try:
+            if self.index.ntotal == 0 or len(embeddings) == 0:
+                return [[] for _ in range(len(embeddings))]
+            top_k = min(top_k, self.index.ntotal)
+            similarities, indices = self.index.search(self._normalized(embeddings), top_k)
+            return [self._to_results(sims, idxs) for sims, idxs in zip(similarities, indices)]
+        except Exception as e:
+            logger.error(f"Failed to batch search by embeddings: {e}")
+            raise
+    
+    @staticmethod
+    def _read_article_ids(index_data: dict) -> np.ndarray:
+        """Read the ID array from saved index data, accepting the old dict map."""
+        if 'article_ids' in index_data:
+            return np.frombuffer(index_data['article_ids'], dtype=np.int64).copy()
+        id_map = index_data['article_id_map']
+        return np.array([id_map[i] for i in range(len(id_map))], dtype=np.int64)
+    
+    @staticmethod
+    def _ids_path(filepath: str) -> str:
+        """Sidecar file holding the article IDs of a native index file."""
+        return filepath + ".ids.npy"
+    
     def save_index(self, filepath: str):
         """
         Save FAISS index to disk.
         
+        A path ending in NATIVE_INDEX_SUFFIX is written with faiss.write_index
+        (plus an .ids.npy sidecar) so it can be memory-mapped on load; any
+        other path gets the compressed save_to_bytes format. Files are
+        replaced atomically, so a crash mid-write leaves the old index intact.
+        
         Args:
             filepath: Path to save the index
         """
         try:
-            index_data = {
-                'index': faiss.serialize_index(self.index),
-                'article_id_map': self.article_id_map
-            }
-            
-            with open(filepath, 'wb') as f:
-                pickle.dump(index_data, f)
+            # IDs are written first so a finished index file always has them
+            if filepath.endswith(NATIVE_INDEX_SUFFIX):
+                self._replace_atomically(
+                    self._ids_path(filepath), lambda tmp: self._save_npy(tmp, self.article_ids)
+                )
+                self._replace_atomically(filepath, lambda tmp: faiss.write_index(self.index, tmp))
+            else:
+                data = self.save_to_bytes()
+                
+                def write(tmp):
+                    with open(tmp, 'wb') as f:
+                        f.write(data)
+                self._replace_atomically(filepath, write)
             
             logger.info(f"FAISS index saved to {filepath}")
         except Exception as e:
             logger.error(f"Failed to save FAISS index: {e}")
             raise
     
-    def load_index(self, filepath: str):
+    def load_index(self, filepath: str, mmap: bool = False):
         """
         Load FAISS index from disk.
         
+        With mmap, native index files are memory-mapped: IVF inverted lists stay
+        on disk and are paged in by queries, but the index becomes read-only.
+        Other index types ignore the flag and load normally.
+        
         Args:
             filepath: Path to load the index from
+            mmap: Memory-map native files; only for callers that never add vectors
         """
         try:
-            with open(filepath, 'rb') as f:
-                index_data = pickle.load(f)
-            
-            self.index = faiss.deserialize_index(index_data['index'])
-            self.article_id_map = index_data['article_id_map']
+            if filepath.endswith(NATIVE_INDEX_SUFFIX):
+                io_flags = faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY if mmap else 0
+                index = faiss.read_index(filepath, io_flags)
+                article_ids = np.load(self._ids_path(filepath))
+                self._install(index, article_ids)
+            else:
+                with open(filepath, 'rb') as f:
+                    data = f.read()
+                self._restore(data)
             
             logger.info(f"FAISS index loaded from {filepath}. Total vectors: {self.index.ntotal}")
         except Exception as e:
@@ -255,20 +568,17 @@ class FAISSService:
         """
         Serialize FAISS index to bytes (for storing in database).
         
+        Layout before compression is two little-endian uint32 lengths, the
+        native FAISS index bytes and the int64 article ID array.
+        
         Returns:
-            Serialized index as bytes
+            LZ4-compressed index bytes
         """
         try:
-            index_data = {
-                'index': faiss.serialize_index(self.index),
-                'article_id_map': self.article_id_map
-            }
-            
-            buffer = io.BytesIO()
-            pickle.dump(index_data, buffer)
-            buffer.seek(0)
-            
-            return buffer.read()
+            index_buf = faiss.serialize_index(self.index).tobytes()
+            ids_buf = self.article_ids.tobytes()
+            payload = struct.pack("<II", len(index_buf), len(ids_buf)) + index_buf + ids_buf
+            return lz4.frame.compress(payload)
         except Exception as e:
             logger.error(f"Failed to serialize FAISS index: {e}")
             raise
@@ -281,24 +591,48 @@ class FAISSService:
             data: Serialized index bytes
         """
         try:
-            buffer = io.BytesIO(data)
-            index_data = pickle.load(buffer)
-            
-            self.index = faiss.deserialize_index(index_data['index'])
-            self.article_id_map = index_data['article_id_map']
+            self._restore(data)
             
             logger.info(f"FAISS index loaded from bytes. Total vectors: {self.index.ntotal}")
         except Exception as e:
             logger.error(f"Failed to deserialize FAISS index: {e}")
             raise
     
+    def _restore(self, data: bytes):
+        """Install an index from save_to_bytes output or the older pickled dict."""
+        if data[:4] == _LZ4_FRAME_MAGIC:
+            payload = lz4.frame.decompress(data)
+            index_len, ids_len = struct.unpack_from("<II", payload)
+            start = struct.calcsize("<II")
+            index_buf = np.frombuffer(payload, dtype=np.uint8, count=index_len, offset=start)
+            index = faiss.deserialize_index(index_buf)
+            article_ids = np.frombuffer(
+                payload, dtype=np.int64, count=ids_len // 8, offset=start + index_len
+            ).copy()
+        else:
+            index_data = pickle.loads(data)
+            index = faiss.deserialize_index(index_data['index'])
+            article_ids = self._read_article_ids(index_data)
+        self._install(index, article_ids)
+    
+    def _install(self, index, article_ids: np.ndarray):
+        """Validate a loaded index and make it the live one."""
+        if index.metric_type != faiss.METRIC_INNER_PRODUCT:
+            raise ValueError("Saved index uses L2 distance; rebuild it from stored embeddings")
+        if hasattr(index, "hnsw"):
+            # Search breadth is a runtime setting, not whatever the file was saved with
+            index.hnsw.efSearch = settings.FAISS_HNSW_EF_SEARCH
+        self.index = index
+        self.article_ids = np.asarray(article_ids, dtype=np.int64)
+    
     def get_index_stats(self) -> dict:
         """Get statistics about the FAISS index."""
         return {
             "total_vectors": self.index.ntotal,
             "dimension": self.dimension,
-            "index_type": "IndexFlatL2",
-            "articles_indexed": len(self.article_id_map)
+            "index_type": type(self.index).__name__,
+            "omp_threads": faiss.omp_get_max_threads(),
+            "articles_indexed": len(self.article_ids)
         }
 
 
@@ -1,20 +1,64 @@
 """Groq API service for article summarization."""
-import requests
-from bs4 import BeautifulSoup
-from groq import Groq
-from typing import List, Optional
+import asyncio
+import hashlib
+import time
+import httpx
+import lxml.etree
+import lxml.html
+from groq import AsyncGroq, Groq
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Tuple
 from loguru import logger
 from app.config import get_settings
+from app.services.http_session import http_session
+from app.services.redis_service import redis_service
 
 settings = get_settings()
 
+UA_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# Updated to a currently supported Groq model
+_MODEL = "llama-3.1-8b-instant"
+
+_SYSTEM_PROMPT = "You are a professional news summarizer. Provide clear, factual summaries."
+
+_LEVEL_INSTRUCTIONS: Mapping[str, str] = MappingProxyType({
+    "beginner": "Use simple language, short sentences, and avoid jargon. Explain concepts clearly.",
+    "intermediate": "Use clear language with some technical terms. Balance detail with accessibility.",
+    "expert": "Use technical language and industry terminology. Include nuanced analysis."
+})
+
+_PROMPT_TEMPLATE = """Summarize the following article in exactly {num_points} concise bullet points.
+
+Reading level: {reading_level}
+Instructions: {instruction}
+
+Article:
+{article_text}
+
+Provide ONLY the {num_points} bullet points, one per line, starting with a dash (-).
+"""
+
+SUMMARY_CACHE_TTL = 86400
+
 
 class GroqService:
     """Service for article summarization using Groq API."""
     
+    MAX_CONCURRENT_SUMMARIES = 5
+    # Extracted text is served as-is for an hour, then revalidated with the
+    # origin's ETag/Last-Modified; entries are kept a day for revalidation
+    ARTICLE_TEXT_FRESH_SECONDS = 3600
+    ARTICLE_TEXT_TTL = 86400
+    
     def __init__(self):
         """Initialize Groq service."""
         self.client = None
+        self.async_client = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
         self._initialize_client()
     
     def _initialize_client(self):
@@ -25,14 +69,40 @@ class GroqService:
                 return
             
             self.client = Groq(api_key=settings.GROQ_API_KEY)
+            self.async_client = AsyncGroq(api_key=settings.GROQ_API_KEY)
             logger.info("Groq client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Groq client: {e}")
             raise
     
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared keep-alive HTTP client for article fetches, created on first use."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=10,
+                headers=UA_HEADERS,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30)
+            )
+        return self._http_client
+    
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Caps concurrent summaries to stay under the Groq rate limit."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SUMMARIES)
+        return self._semaphore
+    
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+    
     def fetch_article_text(self, url: str) -> Optional[str]:
         """
-        Fetch article text from URL using BeautifulSoup.
+        Fetch article text from URL.
         
         Args:
             url: Article URL
@@ -41,38 +111,202 @@ class GroqService:
             Extracted article text or None if failed
         """
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
+            key, cached = self._get_cached_text(url)
+            if cached and self._is_fresh(cached):
+                return cached["text"]
             
-            response = requests.get(url, headers=headers, timeout=10)
+            headers = {**UA_HEADERS, **self._conditional_headers(cached)}
+            response = http_session.get(url, headers=headers, timeout=10)
+            if response.status_code == 304 and cached:
+                self._cache_text(key, cached["text"], cached.get("etag"), cached.get("last_modified"))
+                return cached["text"]
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'lxml')
+            text = self._extract_text(response.content, url)
+            if text:
+                self._cache_text(key, text, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+            return text
             
-            # Remove script and style elements
-            for script in soup(["script", "style", "nav", "header", "footer"]):
-                script.decompose()
+        except Exception as e:
+            logger.error(f"Failed to fetch article from {url}: {e}")
+            return None
+    
+    async def fetch_article_text_async(self, url: str) -> Optional[str]:
+        """
+        Fetch article text from URL without blocking the event loop.
+        
+        Args:
+            url: Article URL
             
-            # Try to find main content
-            article_content = soup.find('article') or soup.find('main') or soup.find('body')
+        Returns:
+            Extracted article text or None if failed
+        """
+        try:
+            key, cached = self._get_cached_text(url)
+            if cached and self._is_fresh(cached):
+                return cached["text"]
             
-            if article_content:
-                # Get text from paragraphs
-                paragraphs = article_content.find_all('p')
-                text = ' '.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
-                
-                if text:
-                    logger.info(f"Extracted {len(text)} characters from {url}")
-                    return text[:10000]  # Limit to 10k characters
+            response = await self.http_client.get(url, headers=self._conditional_headers(cached))
+            if response.status_code == 304 and cached:
+                self._cache_text(key, cached["text"], cached.get("etag"), cached.get("last_modified"))
+                return cached["text"]
+            response.raise_for_status()
             
-            logger.warning(f"Could not extract article text from {url}")
-            return None
+            # Parsing is CPU-bound; keep it off the event loop
+            text = await asyncio.to_thread(self._extract_text, response.content, url)
+            if text:
+                self._cache_text(key, text, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+            return text
             
         except Exception as e:
             logger.error(f"Failed to fetch article from {url}: {e}")
             return None
     
+    @staticmethod
+    def _get_cached_text(url: str) -> Tuple[str, Optional[dict]]:
+        """Return the Redis key for a URL's extracted text and any cached entry."""
+        key = f"article_text:{hashlib.sha256(url.encode()).hexdigest()}"
+        return key, redis_service.get(key)
+    
+    def _is_fresh(self, cached: dict) -> bool:
+        """Whether a cached entry can be used without asking the origin."""
+        return time.time() - cached.get("fetched_at", 0) < self.ARTICLE_TEXT_FRESH_SECONDS
+    
+    @staticmethod
+    def _conditional_headers(cached: Optional[dict]) -> dict:
+        """Validators that let the origin answer 304 instead of resending the page."""
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        return headers
+    
+    def _cache_text(self, key: str, text: str, etag: Optional[str], last_modified: Optional[str]):
+        """Store extracted text with its validators."""
+        redis_service.set(
+            key,
+            {"text": text, "etag": etag, "last_modified": last_modified, "fetched_at": time.time()},
+            ttl=self.ARTICLE_TEXT_TTL
+        )
+    
+    @staticmethod
+    def _extract_text(content: bytes, url: str) -> Optional[str]:
+        """
+        Extract paragraph text from an article page.
+        
+        Args:
+            content: Raw HTML
+            url: Article URL (for logging)
+            
+        Returns:
+            Extracted article text or None if nothing was found
+        """
+        tree = lxml.html.document_fromstring(content)
+        
+        # Remove script and style elements (keeping the text that follows them)
+        lxml.etree.strip_elements(tree, "script", "style", "nav", "header", "footer", with_tail=False)
+        
+        # Try to find main content
+        article_content = tree.find('.//article')
+        if article_content is None:
+            article_content = tree.find('.//main')
+        if article_content is None:
+            article_content = tree.find('body')
+        
+        if article_content is not None:
+            # Get text from paragraphs; lxml walks the tree in C
+            paragraphs = (p.text_content().strip() for p in article_content.iter('p'))
+            text = ' '.join(p for p in paragraphs if p)
+            
+            if text:
+                logger.info(f"Extracted {len(text)} characters from {url}")
+                return text[:10000]  # Limit to 10k characters
+        
+        logger.warning(f"Could not extract article text from {url}")
+        return None
+    
+    @staticmethod
+    def _build_request(article_text: str, reading_level: str, num_points: int) -> dict:
+        """Build the chat completion arguments for a summary request."""
+        instruction = _LEVEL_INSTRUCTIONS.get(reading_level, _LEVEL_INSTRUCTIONS["intermediate"])
+        prompt = _PROMPT_TEMPLATE.format(
+            num_points=num_points,
+            reading_level=reading_level,
+            instruction=instruction,
+            article_text=article_text[:8000]
+        )
+        
+        return {
+            "messages": [
+                {
+                    "role": "system",
+                    "content": _SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "model": _MODEL,
+            "temperature": 0.3,
+            "max_tokens": 500,
+            "stream": True
+        }
+    
+    @staticmethod
+    def _summary_cache_key(request: dict) -> str:
+        """Key a summary by the exact model and prompt that produce it."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(request["model"].encode())
+        digest.update(b"\0")
+        digest.update(request["messages"][-1]["content"].encode())
+        return f"summary:{digest.hexdigest()}"
+    
+    @staticmethod
+    def _has_enough_points(text: str, num_points: int) -> bool:
+        """True once num_points bullet lines have been fully received."""
+        finished_lines = text.split('\n')[:-1]
+        points = 0
+        for line in finished_lines:
+            cleaned = line.strip().lstrip('-*•').strip()
+            if cleaned and not cleaned.startswith('#'):
+                points += 1
+        return points >= num_points
+    
+    @staticmethod
+    def _parse_summary(summary_text: str, reading_level: str, num_points: int) -> dict:
+        """Turn the model's bullet list into the summary result dict."""
+        summary_text = summary_text.strip()
+        
+        # Parse bullet points
+        lines = [line.strip() for line in summary_text.split('\n') if line.strip()]
+        bullet_points = []
+        
+        for line in lines:
+            # Remove leading dash, asterisk, or number
+            cleaned = line.lstrip('-*•').strip()
+            if cleaned and not cleaned.startswith('#'):
+                bullet_points.append(cleaned)
+        
+        # Ensure we have the requested number of points
+        if len(bullet_points) < num_points:
+            logger.warning(f"Generated only {len(bullet_points)} points instead of {num_points}")
+        
+        summary = bullet_points[:num_points] if bullet_points else [summary_text]
+        
+        # Calculate word count
+        word_count = sum(len(point.split()) for point in summary)
+        
+        logger.info(f"Generated summary with {len(summary)} points and {word_count} words")
+        
+        return {
+            "summary": summary,
+            "word_count": word_count,
+            "reading_level": reading_level
+        }
+    
     def summarize(
         self, 
         article_text: str, 
@@ -94,73 +328,79 @@ class GroqService:
             if not self.client:
                 raise ValueError("Groq client not initialized. Check GROQ_API_KEY.")
             
-            # Create prompt based on reading level
-            level_instructions = {
-                "beginner": "Use simple language, short sentences, and avoid jargon. Explain concepts clearly.",
-                "intermediate": "Use clear language with some technical terms. Balance detail with accessibility.",
-                "expert": "Use technical language and industry terminology. Include nuanced analysis."
-            }
-            
-            instruction = level_instructions.get(reading_level, level_instructions["intermediate"])
-            
-            prompt = f"""Summarize the following article in exactly {num_points} concise bullet points.
-
-Reading level: {reading_level}
-Instructions: {instruction}
-
-Article:
-{article_text[:8000]}
-
-Provide ONLY the {num_points} bullet points, one per line, starting with a dash (-).
-"""
-            
-            # Call Groq API
-            chat_completion = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a professional news summarizer. Provide clear, factual summaries."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                # Updated to a currently supported Groq model
-                model="llama-3.1-8b-instant",
-                temperature=0.3,
-                max_tokens=500
-            )
-            
-            # Extract summary
-            summary_text = chat_completion.choices[0].message.content.strip()
+            request = self._build_request(article_text, reading_level, num_points)
+            cache_key = self._summary_cache_key(request)
+            cached = redis_service.get(cache_key)
+            if cached:
+                return cached
             
-            # Parse bullet points
-            lines = [line.strip() for line in summary_text.split('\n') if line.strip()]
-            bullet_points = []
+            # Stream the completion and hang up once enough bullets are in
+            stream = self.client.chat.completions.create(**request)
+            summary_text = ""
+            try:
+                for chunk in stream:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if not delta:
+                        continue
+                    summary_text += delta
+                    if '\n' in delta and self._has_enough_points(summary_text, num_points):
+                        break
+            finally:
+                stream.response.close()
             
-            for line in lines:
-                # Remove leading dash, asterisk, or number
-                cleaned = line.lstrip('-*•').strip()
-                if cleaned and not cleaned.startswith('#'):
-                    bullet_points.append(cleaned)
+            result = self._parse_summary(summary_text, reading_level, num_points)
+            redis_service.set(cache_key, result, ttl=SUMMARY_CACHE_TTL)
+            return result
             
-            # Ensure we have the requested number of points
-            if len(bullet_points) < num_points:
-                logger.warning(f"Generated only {len(bullet_points)} points instead of {num_points}")
+        except Exception as e:
+            logger.error(f"Failed to summarize article: {e}")
+            raise
+    
+    async def summarize_async(
+        self, 
+        article_text: str, 
+        reading_level: str = "intermediate",
+        num_points: int = 3
+    ) -> dict:
+        """
+        Summarize article using the async Groq client.
+        
+        Args:
+            article_text: Full article text
+            reading_level: Target reading level (beginner/intermediate/expert)
+            num_points: Number of bullet points to generate
             
-            summary = bullet_points[:num_points] if bullet_points else [summary_text]
+        Returns:
+            Dictionary with summary and metadata
+        """
+        try:
+            if not self.async_client:
+                raise ValueError("Groq client not initialized. Check GROQ_API_KEY.")
             
-            # Calculate word count
-            word_count = sum(len(point.split()) for point in summary)
+            request = self._build_request(article_text, reading_level, num_points)
+            cache_key = self._summary_cache_key(request)
+            cached = redis_service.get(cache_key)
+            if cached:
+                return cached
             
-            logger.info(f"Generated summary with {len(summary)} points and {word_count} words")
+            summary_text = ""
+            async with self.semaphore:
+                # Stream the completion and hang up once enough bullets are in
+                stream = await self.async_client.chat.completions.create(**request)
+                try:
+                    async for chunk in stream:
+                        delta = chunk.choices[0].delta.content if chunk.choices else None
+                        if not delta:
+                            continue
+                        summary_text += delta
+                        if '\n' in delta and self._has_enough_points(summary_text, num_points):
+                            break
+                finally:
+                    await stream.response.aclose()
             
-            return {
-                "summary": summary,
-                "word_count": word_count,
-                "reading_level": reading_level
-            }
+            result = self._parse_summary(summary_text, reading_level, num_points)
+            redis_service.set(cache_key, result, ttl=SUMMARY_CACHE_TTL)
+            return result
             
         except Exception as e:
             logger.error(f"Failed to summarize article: {e}")
@@ -194,6 +434,56 @@ Provide ONLY the {num_points} bullet points, one per line, starting with a dash
         except Exception as e:
             logger.error(f"Failed to summarize article from URL: {e}")
             raise
+    
+    async def summarize_from_url_async(
+        self, 
+        url: str, 
+        reading_level: str = "intermediate"
+    ) -> dict:
+        """
+        Fetch and summarize article from URL without blocking the event loop.
+        
+        Args:
+            url: Article URL
+            reading_level: Target reading level
+            
+        Returns:
+            Dictionary with summary and metadata
+        """
+        try:
+            article_text = await self.fetch_article_text_async(url)
+            
+            if not article_text:
+                raise ValueError(f"Could not extract article text from {url}")
+            
+            return await self.summarize_async(article_text, reading_level)
+            
+        except Exception as e:
+            logger.error(f"Failed to summarize article from URL: {e}")
+            raise
+    
+    async def summarize_urls(
+        self, 
+        urls: List[str], 
+        reading_level: str = "intermediate"
+    ) -> List[Optional[dict]]:
+        """
+        Fetch and summarize several articles concurrently.
+        
+        Groq calls are capped by MAX_CONCURRENT_SUMMARIES.
+        
+        Args:
+            urls: Article URLs
+            reading_level: Target reading level
+            
+        Returns:
+            Summary dicts in URL order; None for URLs that failed
+        """
+        results = await asyncio.gather(
+            *(self.summarize_from_url_async(url, reading_level) for url in urls),
+            return_exceptions=True
+        )
+        return [None if isinstance(result, Exception) else result for result in results]
 
 
 # Global Groq service instance
@@ -0,0 +1,21 @@
+"""Shared pooled HTTP session for the services' blocking requests calls."""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _build_session() -> requests.Session:
+    """Create a keep-alive session with connection pooling and light retries."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=50,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504])
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Global session; reusing it skips a TCP+TLS handshake per call
+http_session = _build_session()
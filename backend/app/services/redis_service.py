@@ -1,12 +1,40 @@
 """Redis caching service for search results and recommendations."""
+import hashlib
 import redis
 import json
-from typing import Optional, Any
+import lz4.frame
+import orjson
+from typing import Any, Dict, List, Optional
 from loguru import logger
 from app.config import get_settings
 
 settings = get_settings()
 
+# Encoded values carry a one-byte tag: plain orjson or LZ4-compressed orjson.
+# Untagged values are JSON written before the tag existed.
+_TAG_RAW = b"R"
+_TAG_LZ4 = b"L"
+_COMPRESS_THRESHOLD = 4096
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _encode(value: Any) -> bytes:
+    """Serialize a value for Redis, compressing large payloads."""
+    data = orjson.dumps(value, option=_ORJSON_OPTIONS)
+    if len(data) > _COMPRESS_THRESHOLD:
+        return _TAG_LZ4 + lz4.frame.compress(data)
+    return _TAG_RAW + data
+
+
+def _decode(value: bytes) -> Any:
+    """Inverse of _encode, accepting legacy untagged JSON."""
+    tag = value[:1]
+    if tag == _TAG_RAW:
+        return orjson.loads(value[1:])
+    if tag == _TAG_LZ4:
+        return orjson.loads(lz4.frame.decompress(value[1:]))
+    return json.loads(value)
+
 
 class RedisService:
     """Service for Redis caching."""
@@ -24,7 +52,7 @@ class RedisService:
                 port=settings.REDIS_PORT,
                 password=settings.REDIS_PASSWORD if settings.REDIS_PASSWORD else None,
                 db=settings.REDIS_DB,
-                decode_responses=True,
+                decode_responses=False,
                 socket_connect_timeout=5
             )
             
@@ -57,7 +85,7 @@ class RedisService:
             
             if value:
                 logger.debug(f"Cache hit for key: {key}")
-                return json.loads(value)
+                return _decode(value)
             
             logger.debug(f"Cache miss for key: {key}")
             return None
@@ -80,7 +108,7 @@ class RedisService:
                 return
             
             ttl = ttl or settings.CACHE_TTL
-            serialized_value = json.dumps(value)
+            serialized_value = _encode(value)
             
             self.client.setex(key, ttl, serialized_value)
             logger.debug(f"Cached key: {key} with TTL: {ttl}s")
@@ -88,6 +116,91 @@ class RedisService:
         except Exception as e:
             logger.error(f"Failed to set cache key {key}: {e}")
     
+    def get_raw(self, key: str) -> Optional[bytes]:
+        """
+        Get already-serialized bytes from Redis cache.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached bytes or None if not found
+        """
+        try:
+            if not self.client:
+                return None
+            
+            value = self.client.get(key)
+            logger.debug(f"Cache {'hit' if value else 'miss'} for key: {key}")
+            return value
+            
+        except Exception as e:
+            logger.error(f"Failed to get cache key {key}: {e}")
+            return None
+    
+    def set_raw(self, key: str, value: bytes, ttl: int = None):
+        """
+        Set already-serialized bytes in Redis cache.
+        
+        Args:
+            key: Cache key
+            value: Serialized value to cache
+            ttl: Time to live in seconds (default: settings.CACHE_TTL)
+        """
+        try:
+            if not self.client:
+                return
+            
+            ttl = ttl or settings.CACHE_TTL
+            self.client.setex(key, ttl, value)
+            logger.debug(f"Cached key: {key} with TTL: {ttl}s")
+            
+        except Exception as e:
+            logger.error(f"Failed to set cache key {key}: {e}")
+    
+    def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get several values from Redis cache in one round trip.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Cached values in key order, None where a key is missing
+        """
+        try:
+            if not self.client or not keys:
+                return [None] * len(keys)
+            
+            values = self.client.mget(keys)
+            return [_decode(value) if value else None for value in values]
+            
+        except Exception as e:
+            logger.error(f"Failed to get {len(keys)} cache keys: {e}")
+            return [None] * len(keys)
+    
+    def mset(self, mapping: Dict[str, Any], ttl: int = None):
+        """
+        Set several values in Redis cache in one round trip.
+        
+        Args:
+            mapping: Cache key to value
+            ttl: Time to live in seconds (default: settings.CACHE_TTL)
+        """
+        try:
+            if not self.client or not mapping:
+                return
+            
+            ttl = ttl or settings.CACHE_TTL
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                pipe.setex(key, ttl, _encode(value))
+            pipe.execute()
+            logger.debug(f"Cached {len(mapping)} keys with TTL: {ttl}s")
+            
+        except Exception as e:
+            logger.error(f"Failed to set {len(mapping)} cache keys: {e}")
+    
     def delete(self, key: str):
         """
         Delete key from Redis cache.
@@ -116,10 +229,19 @@ class RedisService:
             if not self.client:
                 return
             
-            keys = self.client.keys(pattern)
-            if keys:
-                self.client.delete(*keys)
-                logger.info(f"Deleted {len(keys)} keys matching pattern: {pattern}")
+            # SCAN walks the keyspace incrementally instead of blocking the
+            # server the way KEYS does; deletes go out in pipelined batches
+            pipe = self.client.pipeline(transaction=False)
+            deleted = 0
+            for key in self.client.scan_iter(match=pattern, count=500):
+                pipe.delete(key)
+                deleted += 1
+                if deleted % 500 == 0:
+                    pipe.execute()
+            pipe.execute()
+            
+            if deleted:
+                logger.info(f"Deleted {deleted} keys matching pattern: {pattern}")
             
         except Exception as e:
             logger.error(f"Failed to clear pattern {pattern}: {e}")
@@ -128,18 +250,25 @@ class RedisService:
         """
         Generate cache key from prefix and parameters.
         
+        Parameters are hashed into a fixed 32-character suffix, so keys stay
+        short however long the query is. Anything that clear_pattern must be
+        able to match (e.g. a user ID) belongs in the prefix.
+        
         Args:
-            prefix: Key prefix (e.g., "search", "recommend")
+            prefix: Key prefix (e.g., "search", "recommend:user_id:42")
             **kwargs: Key-value pairs to include in key
             
         Returns:
             Generated cache key
         """
-        parts = [prefix]
-        for k, v in sorted(kwargs.items()):
-            parts.append(f"{k}:{v}")
+        digest = hashlib.blake2b(digest_size=16)
+        for k in sorted(kwargs):
+            digest.update(k.encode())
+            digest.update(b"=")
+            digest.update(str(kwargs[k]).encode())
+            digest.update(b"\0")
         
-        return ":".join(parts)
+        return f"{prefix}:{digest.hexdigest()}"
 
 
 # Global Redis service instance
@@ -1,27 +1,183 @@
 """Resend email service for sending newsletters."""
+import asyncio
+import gzip
+import hashlib
+import re
+import threading
+from functools import lru_cache
+import httpx
+import orjson
 import requests
-from typing import List, Dict
+from itertools import islice
+from cachetools import LRUCache
+from jinja2 import Environment
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib3.util.retry import Retry
 from loguru import logger
 from app.config import get_settings
 
 settings = get_settings()
 
+# Inline CSS is minified once at import; every recipient gets the compact copy
+_RAW_CSS = """
+    body {
+        font-family: Arial, sans-serif;
+        line-height: 1.6;
+        color: #333;
+        max-width: 600px;
+        margin: 0 auto;
+        padding: 20px;
+    }
+    .header {
+        background-color: #4CAF50;
+        color: white;
+        padding: 20px;
+        text-align: center;
+        border-radius: 5px;
+    }
+    .article {
+        background-color: #f9f9f9;
+        padding: 15px;
+        margin: 15px 0;
+        border-radius: 5px;
+        border-left: 4px solid #4CAF50;
+    }
+    .article-title {
+        font-size: 18px;
+        font-weight: bold;
+        margin-bottom: 10px;
+        color: #2c3e50;
+    }
+    .article-source {
+        color: #7f8c8d;
+        font-size: 12px;
+        margin-bottom: 8px;
+    }
+    .article-content {
+        color: #555;
+        margin-bottom: 10px;
+    }
+    .article-link {
+        color: #4CAF50;
+        text-decoration: none;
+        font-weight: bold;
+    }
+    .footer {
+        text-align: center;
+        margin-top: 30px;
+        padding-top: 20px;
+        border-top: 1px solid #ddd;
+        color: #999;
+        font-size: 12px;
+    }
+"""
+
+_CSS = re.sub(r"\s*([{};:,])\s*", r"\1", re.sub(r"\s+", " ", _RAW_CSS)).replace(";}", "}").strip()
+
+# Static newsletter shell; the whole page is compiled once as a Jinja2 template
+_NEWSLETTER_HEAD = (
+    '<!DOCTYPE html><html><head><style>' + _CSS + '</style></head><body>'
+    '<div class="header"><h1>Your AI-Curated Newsletter</h1><p>Personalized news just for you</p></div>'
+)
+
+_ARTICLE_LOOP = (
+    '{% for a in articles %}'
+    '<div class="article">'
+    '<div class="article-title">{{ a.title or "Untitled" }}</div>'
+    '<div class="article-source">Source: {{ a.source or "Unknown" }}</div>'
+    '<div class="article-content">{{ a.content or "" }}</div>'
+    '<a href="{{ a.url or "#" }}" class="article-link">Read More →</a>'
+    '</div>'
+    '{% endfor %}'
+)
+
+# Article fields used by _ARTICLE_LOOP; all of them feed the render cache key
+_RENDERED_FIELDS = ("url", "title", "source", "content")
+
+_NEWSLETTER_FOOT = (
+    '<div class="footer">'
+    '<p>You received this email because you subscribed to our AI Newsletter.</p>'
+    '<p>© 2026 AI Newsletter. All rights reserved.</p>'
+    '</div></body></html>'
+)
+
+# Autoescaping covers every article field, including the href
+_NEWSLETTER_TEMPLATE = Environment(autoescape=True).from_string(
+    _NEWSLETTER_HEAD + _ARTICLE_LOOP + _NEWSLETTER_FOOT
+)
+
 
 class ResendService:
     """Service for sending emails using Resend API."""
     
+    BATCH_SIZE = 100  # Resend's per-call limit for /emails/batch
+    GZIP_LEVEL = 3
+    
     def __init__(self):
         """Initialize Resend service."""
         self.api_key = settings.RESEND_API_KEY
         self.base_url = "https://api.resend.com/emails"
         self.from_email = "newsletter@yourdomain.com"  # Configure in production
+        
+        # One pooled keep-alive session; bulk sends reuse the TLS connection.
+        # urllib3 does not retry POSTs on status codes, so a send is never duplicated.
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+        self._async_client: Optional[httpx.AsyncClient] = None
+        # Rendered newsletters keyed by a digest of the article URLs they contain
+        self._rendered: LRUCache = LRUCache(maxsize=256)
+        self._rendered_lock = threading.Lock()
+    
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Shared keep-alive async HTTP client, created on first use."""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                timeout=30,
+                http2=True,
+                headers=self.headers,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=30)
+            )
+        return self._async_client
+    
+    async def aclose(self):
+        """Close the shared async HTTP client."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+    
+    def _encode_body(self, payload) -> Tuple[bytes, Dict[str, str]]:
+        """
+        Serialize a request payload, gzip-compressing it when enabled.
+        
+        Args:
+            payload: JSON-serializable request body
+            
+        Returns:
+            Tuple of (body bytes, extra request headers)
+        """
+        body = orjson.dumps(payload)
+        if not settings.RESEND_GZIP_REQUESTS:
+            return body, {}
+        return gzip.compress(body, compresslevel=self.GZIP_LEVEL), {"Content-Encoding": "gzip"}
     
     def send_newsletter(
         self, 
         to_email: str,
         subject: str,
-        html_content: str,
-        articles: List[Dict] = None
+        articles: List[Dict] = None,
+        html_content: Optional[str] = None
     ) -> bool:
         """
         Send newsletter email to user.
@@ -29,8 +185,8 @@ class ResendService:
         Args:
             to_email: Recipient email address
             subject: Email subject
-            html_content: HTML content of the email
             articles: List of article dictionaries
+            html_content: Pre-rendered HTML (optional, rendered from articles if None)
             
         Returns:
             True if email sent successfully, False otherwise
@@ -41,14 +197,62 @@ class ResendService:
                 logger.info(f"Mock email sent to {to_email} with subject: {subject}")
                 return True
             
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
+            # If articles provided but no html_content, render (or reuse) it
+            if not html_content and articles:
+                html_content = self.render_newsletter(articles)
+            
+            payload = {
+                "from": self.from_email,
+                "to": [to_email],
+                "subject": subject,
+                "html": html_content
             }
             
-            # If articles provided but no html_content, generate it
+            body, extra_headers = self._encode_body(payload)
+            response = self.session.post(self.base_url, data=body, headers=extra_headers, timeout=10)
+            
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            
+            logger.info(f"Email sent successfully to {to_email}. ID: {data.get('id')}")
+            return True
+            
+        except requests.RequestException as e:
+            logger.error(f"Failed to send email via Resend: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected error in Resend service: {e}")
+            return False
+    
+    async def send_newsletter_async(
+        self, 
+        to_email: str,
+        subject: str,
+        articles: List[Dict] = None,
+        html_content: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> bool:
+        """
+        Send newsletter email to user without blocking the event loop.
+        
+        Args:
+            to_email: Recipient email address
+            subject: Email subject
+            articles: List of article dictionaries
+            html_content: Pre-rendered HTML (optional, rendered from articles if None)
+            client: App-scoped HTTP client (optional, uses the service's own if None)
+            
+        Returns:
+            True if email sent successfully, False otherwise
+        """
+        try:
+            if not self.api_key:
+                logger.warning("RESEND_API_KEY not set. Email not sent (mock mode).")
+                logger.info(f"Mock email sent to {to_email} with subject: {subject}")
+                return True
+            
             if not html_content and articles:
-                html_content = self._generate_newsletter_html(articles)
+                html_content = self.render_newsletter(articles)
             
             payload = {
                 "from": self.from_email,
@@ -57,121 +261,156 @@ class ResendService:
                 "html": html_content
             }
             
-            response = requests.post(
-                self.base_url,
-                json=payload,
-                headers=headers,
-                timeout=10
+            body, extra_headers = self._encode_body(payload)
+            response = await (client or self.async_client).post(
+                self.base_url, content=body, headers={**self.headers, **extra_headers}
             )
             
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             logger.info(f"Email sent successfully to {to_email}. ID: {data.get('id')}")
             return True
             
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to send email via Resend: {e}")
             return False
         except Exception as e:
             logger.error(f"Unexpected error in Resend service: {e}")
             return False
     
-    def _generate_newsletter_html(self, articles: List[Dict]) -> str:
+    def _batch_payloads(self, items: Iterable[Dict]) -> List[List[Dict]]:
+        """Turn recipient items into Resend batch payloads of at most BATCH_SIZE."""
+        emails = (
+            {
+                "from": self.from_email,
+                "to": [item["email"]],
+                "subject": item["subject"],
+                "html": item.get("html") or self.render_newsletter(item["articles"])
+            }
+            for item in items
+        )
+        payloads = []
+        while True:
+            chunk = list(islice(emails, self.BATCH_SIZE))
+            if not chunk:
+                return payloads
+            payloads.append(chunk)
+    
+    def send_newsletter_batch(self, items: List[Dict]) -> List[str]:
         """
-        Generate HTML newsletter from articles.
+        Send many newsletters through Resend's batch endpoint.
         
         Args:
-            articles: List of article dictionaries
+            items: Dicts with email, subject and either html or articles
             
         Returns:
-            HTML string
+            IDs of the emails Resend accepted
         """
-        html = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {
-                    font-family: Arial, sans-serif;
-                    line-height: 1.6;
-                    color: #333;
-                    max-width: 600px;
-                    margin: 0 auto;
-                    padding: 20px;
-                }
-                .header {
-                    background-color: #4CAF50;
-                    color: white;
-                    padding: 20px;
-                    text-align: center;
-                    border-radius: 5px;
-                }
-                .article {
-                    background-color: #f9f9f9;
-                    padding: 15px;
-                    margin: 15px 0;
-                    border-radius: 5px;
-                    border-left: 4px solid #4CAF50;
-                }
-                .article-title {
-                    font-size: 18px;
-                    font-weight: bold;
-                    margin-bottom: 10px;
-                    color: #2c3e50;
-                }
-                .article-source {
-                    color: #7f8c8d;
-                    font-size: 12px;
-                    margin-bottom: 8px;
-                }
-                .article-content {
-                    color: #555;
-                    margin-bottom: 10px;
-                }
-                .article-link {
-                    color: #4CAF50;
-                    text-decoration: none;
-                    font-weight: bold;
-                }
-                .footer {
-                    text-align: center;
-                    margin-top: 30px;
-                    padding-top: 20px;
-                    border-top: 1px solid #ddd;
-                    color: #999;
-                    font-size: 12px;
-                }
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>Your AI-Curated Newsletter</h1>
-                <p>Personalized news just for you</p>
-            </div>
+        if not self.api_key:
+            logger.warning("RESEND_API_KEY not set. Emails not sent (mock mode).")
+            logger.info(f"Mock batch of {len(items)} emails sent")
+            return []
+        
+        email_ids = []
+        for payload in self._batch_payloads(items):
+            try:
+                body, extra_headers = self._encode_body(payload)
+                response = self.session.post(
+                    f"{self.base_url}/batch", data=body, headers=extra_headers, timeout=30
+                )
+                response.raise_for_status()
+                email_ids.extend(entry["id"] for entry in orjson.loads(response.content).get("data", []))
+            except requests.RequestException as e:
+                logger.error(f"Failed to send batch of {len(payload)} emails via Resend: {e}")
+        
+        logger.info(f"Batch sent {len(email_ids)} of {len(items)} emails")
+        return email_ids
+    
+    async def send_newsletter_batch_async(self, items: List[Dict]) -> List[str]:
         """
+        Send many newsletters, posting all batch chunks concurrently.
         
-        for article in articles:
-            html += f"""
-            <div class="article">
-                <div class="article-title">{article.get('title', 'Untitled')}</div>
-                <div class="article-source">Source: {article.get('source', 'Unknown')}</div>
-                <div class="article-content">{article.get('content', '')}</div>
-                <a href="{article.get('url', '#')}" class="article-link">Read More →</a>
-            </div>
-            """
+        Args:
+            items: Dicts with email, subject and either html or articles
+            
+        Returns:
+            IDs of the emails Resend accepted
+        """
+        if not self.api_key:
+            logger.warning("RESEND_API_KEY not set. Emails not sent (mock mode).")
+            logger.info(f"Mock batch of {len(items)} emails sent")
+            return []
+        
+        payloads = self._batch_payloads(items)
+        bodies = [self._encode_body(payload) for payload in payloads]
+        responses = await asyncio.gather(
+            *(
+                self.async_client.post(f"{self.base_url}/batch", content=body, headers=extra_headers)
+                for body, extra_headers in bodies
+            ),
+            return_exceptions=True
+        )
+        
+        email_ids = []
+        for payload, response in zip(payloads, responses):
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                response.raise_for_status()
+                email_ids.extend(entry["id"] for entry in orjson.loads(response.content).get("data", []))
+            except httpx.HTTPError as e:
+                logger.error(f"Failed to send batch of {len(payload)} emails via Resend: {e}")
+        
+        logger.info(f"Batch sent {len(email_ids)} of {len(items)} emails")
+        return email_ids
+    
+    def render_newsletter(self, articles: List[Dict]) -> str:
+        """
+        Render newsletter HTML, reusing the result for a repeated article set.
         
-        html += """
-            <div class="footer">
-                <p>You received this email because you subscribed to our AI Newsletter.</p>
-                <p>© 2026 AI Newsletter. All rights reserved.</p>
-            </div>
-        </body>
-        </html>
+        Recipients of the same curated bundle share one rendering; the cache
+        key is a fixed-size digest of the rendered article fields in order.
+        
+        Args:
+            articles: List of article dictionaries
+            
+        Returns:
+            HTML string
         """
+        key = self._render_key(articles)
+        with self._rendered_lock:
+            html_content = self._rendered.get(key)
+        if html_content is None:
+            html_content = self._generate_newsletter_html(articles)
+            with self._rendered_lock:
+                self._rendered[key] = html_content
+        return html_content
+    
+    @staticmethod
+    def _render_key(articles: List[Dict]) -> bytes:
+        """Digest of every rendered field in article order, so edited summaries re-render."""
+        digest = hashlib.blake2b(digest_size=16)
+        for article in articles:
+            for field in _RENDERED_FIELDS:
+                digest.update(str(article.get(field) or '').encode())
+                digest.update(b"\0")
+        return digest.digest()
+    
+    def _generate_newsletter_html(self, articles: List[Dict]) -> str:
+        """
+        Generate HTML newsletter from articles.
         
-        return html
+        Args:
+            articles: List of article dictionaries
+            
+        Returns:
+            HTML string
+        """
+        return _NEWSLETTER_TEMPLATE.render(articles=articles)
 
 
-# Global Resend service instance
-resend_service = ResendService()
+@lru_cache()
+def get_resend_service() -> ResendService:
+    """Get the shared Resend service, created on first use."""
+    return ResendService()
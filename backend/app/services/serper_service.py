@@ -1,25 +1,113 @@
 """Serper API service for fetching news articles."""
-import requests
-from typing import List, Dict, Optional
+import asyncio
+import threading
+from functools import lru_cache
+import httpx
+import orjson
+from cachetools import TTLCache
+from typing import List, Dict, Optional, Tuple
 from loguru import logger
 from app.config import get_settings
 
 settings = get_settings()
 
+# Users sharing an interest within the TTL share one upstream call
+_news_cache: TTLCache = TTLCache(maxsize=1024, ttl=600)
+_news_cache_lock = threading.Lock()
+
+# (title, url, content, source, date) templates for the offline fallback
+_MOCK_TEMPLATES = (
+    (
+        "Latest Developments in {q}: What You Need to Know",
+        "https://example.com/{s}-1",
+        "Recent advances in {q} are transforming the industry. Experts discuss the implications and future outlook for this rapidly evolving field.",
+        "TechNews",
+        "2026-01-03"
+    ),
+    (
+        "Breaking: New Research in {q} Shows Promise",
+        "https://example.com/{s}-2",
+        "Scientists announce breakthrough findings related to {q}. The research could have significant real-world applications.",
+        "Science Daily",
+        "2026-01-02"
+    ),
+    (
+        "How {q} is Changing the Future",
+        "https://example.com/{s}-3",
+        "Industry leaders weigh in on the transformative potential of {q} and what it means for businesses and consumers.",
+        "Business Insider",
+        "2026-01-01"
+    ),
+    (
+        "Understanding {q}: A Comprehensive Guide",
+        "https://example.com/{s}-4",
+        "An in-depth look at {q}, covering the basics, current trends, and expert predictions for the future.",
+        "Tech Review",
+        "2025-12-31"
+    ),
+    (
+        "The Impact of {q} on Modern Society",
+        "https://example.com/{s}-5",
+        "Researchers examine how {q} is influencing various aspects of society, from education to healthcare.",
+        "The Guardian",
+        "2025-12-30"
+    ),
+)
+
 
 class SerperService:
     """Service for fetching news using Serper API."""
     
+    MAX_CONCURRENT_REQUESTS = 10
+    MAX_RATE_LIMIT_RETRIES = 2
+    MAX_RETRY_AFTER_SECONDS = 5.0
+    
     def __init__(self):
         """Initialize Serper service."""
         self.api_key = settings.SERPER_API_KEY
         self.base_url = "https://google.serper.dev/news"
+        self.headers = {
+            "X-API-KEY": self.api_key,
+            "Content-Type": "application/json"
+        }
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared keep-alive HTTP client, created on first use."""
+        if self._client is None:
+            # http2 and limits live on the transport; the client ignores them once one is given
+            self._client = httpx.AsyncClient(
+                timeout=10,
+                headers=self.headers,
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True,
+                    retries=3,
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=30)
+                )
+            )
+        return self._client
+    
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Caps in-flight Serper calls so a large fan-out is not throttled."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        return self._semaphore
+    
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
-    def fetch_news(
+    async def fetch_news(
         self, 
         query: str, 
         num_results: int = 10,
-        country: str = "us"
+        country: str = "us",
+        client: Optional[httpx.AsyncClient] = None
     ) -> List[Dict]:
         """
         Fetch news articles from Serper API.
@@ -28,6 +116,7 @@ class SerperService:
             query: Search query (e.g., "AI technology")
             num_results: Number of results to fetch
             country: Country code for news (default: "us")
+            client: App-scoped HTTP client (optional, uses the service's own if None)
             
         Returns:
             List of article dictionaries
@@ -37,10 +126,12 @@ class SerperService:
                 logger.warning("SERPER_API_KEY not set. Using mock data.")
                 return self._get_mock_articles(query, num_results)
             
-            headers = {
-                "X-API-KEY": self.api_key,
-                "Content-Type": "application/json"
-            }
+            key = self._cache_key(query, num_results, country)
+            with _news_cache_lock:
+                cached = _news_cache.get(key)
+            if cached is not None:
+                logger.debug(f"Serper cache hit for query: {query}")
+                return [dict(article) for article in cached]
             
             payload = {
                 "q": query,
@@ -48,15 +139,10 @@ class SerperService:
                 "gl": country
             }
             
-            response = requests.post(
-                self.base_url,
-                json=payload,
-                headers=headers,
-                timeout=10
-            )
+            response = await self._post(client or self.client, orjson.dumps(payload))
             
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Parse Serper response
             articles = []
@@ -70,45 +156,86 @@ class SerperService:
                 }
                 articles.append(article)
             
+            with _news_cache_lock:
+                _news_cache[key] = [dict(article) for article in articles]
+            
             logger.info(f"Fetched {len(articles)} articles for query: {query}")
             return articles
             
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to fetch news from Serper: {e}")
             return self._get_mock_articles(query, num_results)
         except Exception as e:
             logger.error(f"Unexpected error in Serper service: {e}")
             return []
     
-    def fetch_news_by_interests(
+    async def _post(self, client: httpx.AsyncClient, body: bytes) -> httpx.Response:
+        """
+        POST to Serper under the concurrency cap, honoring Retry-After on 429.
+        
+        Args:
+            client: HTTP client to send with
+            body: Serialized JSON payload
+            
+        Returns:
+            The last response received
+        """
+        for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+            async with self.semaphore:
+                response = await client.post(self.base_url, content=body, headers=self.headers)
+            if response.status_code != 429 or attempt == self.MAX_RATE_LIMIT_RETRIES:
+                return response
+            
+            # Wait outside the semaphore so other queries keep flowing
+            try:
+                delay = float(response.headers.get("Retry-After", 1))
+            except ValueError:
+                delay = 1.0
+            delay = min(max(delay, 0.0), self.MAX_RETRY_AFTER_SECONDS)
+            logger.warning(f"Serper rate limited; retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+        return response
+    
+    @staticmethod
+    def _cache_key(query: str, num_results: int, country: str) -> Tuple[str, int, str]:
+        """Normalized key for the in-process news cache."""
+        return (query.lower().strip(), num_results, country)
+    
+    async def fetch_news_by_interests(
         self, 
         interests: List[str], 
-        articles_per_interest: int = 5
+        articles_per_interest: int = 5,
+        client: Optional[httpx.AsyncClient] = None
     ) -> List[Dict]:
         """
-        Fetch news articles for multiple interests.
+        Fetch news articles for multiple interests concurrently.
+        
+        In-flight requests are capped at MAX_CONCURRENT_REQUESTS.
         
         Args:
             interests: List of interest topics
             articles_per_interest: Number of articles per interest
+            client: App-scoped HTTP client (optional)
             
         Returns:
             Combined list of articles
         """
+        results = await asyncio.gather(
+            *(self.fetch_news(interest, articles_per_interest, client=client) for interest in interests),
+            return_exceptions=True
+        )
         all_articles = []
-        
-        for interest in interests:
-            articles = self.fetch_news(interest, articles_per_interest)
+        for interest, articles in zip(interests, results):
+            if isinstance(articles, Exception):
+                logger.error(f"Failed to fetch news for interest {interest}: {articles}")
+                continue
             all_articles.extend(articles)
         
-        # Remove duplicates based on URL
-        unique_articles = []
-        seen_urls = set()
-        
+        # Remove duplicates based on URL; dicts keep first-seen order
+        unique = {}
         for article in all_articles:
-            if article["url"] not in seen_urls:
-                unique_articles.append(article)
-                seen_urls.add(article["url"])
+            unique.setdefault(article["url"], article)
+        unique_articles = list(unique.values())
         
         logger.info(f"Fetched {len(unique_articles)} unique articles for interests: {interests}")
         return unique_articles
@@ -124,46 +251,20 @@ class SerperService:
         Returns:
             List of mock articles
         """
-        mock_articles = [
-            {
-                "title": f"Latest Developments in {query}: What You Need to Know",
-                "url": f"https://example.com/{query.lower().replace(' ', '-')}-1",
-                "content": f"Recent advances in {query} are transforming the industry. Experts discuss the implications and future outlook for this rapidly evolving field.",
-                "source": "TechNews",
-                "date": "2026-01-03"
-            },
-            {
-                "title": f"Breaking: New Research in {query} Shows Promise",
-                "url": f"https://example.com/{query.lower().replace(' ', '-')}-2",
-                "content": f"Scientists announce breakthrough findings related to {query}. The research could have significant real-world applications.",
-                "source": "Science Daily",
-                "date": "2026-01-02"
-            },
+        slug = query.lower().replace(' ', '-')
+        return [
             {
-                "title": f"How {query} is Changing the Future",
-                "url": f"https://example.com/{query.lower().replace(' ', '-')}-3",
-                "content": f"Industry leaders weigh in on the transformative potential of {query} and what it means for businesses and consumers.",
-                "source": "Business Insider",
-                "date": "2026-01-01"
-            },
-            {
-                "title": f"Understanding {query}: A Comprehensive Guide",
-                "url": f"https://example.com/{query.lower().replace(' ', '-')}-4",
-                "content": f"An in-depth look at {query}, covering the basics, current trends, and expert predictions for the future.",
-                "source": "Tech Review",
-                "date": "2025-12-31"
-            },
-            {
-                "title": f"The Impact of {query} on Modern Society",
-                "url": f"https://example.com/{query.lower().replace(' ', '-')}-5",
-                "content": f"Researchers examine how {query} is influencing various aspects of society, from education to healthcare.",
-                "source": "The Guardian",
-                "date": "2025-12-30"
+                "title": title.format(q=query),
+                "url": url.format(s=slug),
+                "content": content.format(q=query),
+                "source": source,
+                "date": date
             }
+            for title, url, content, source, date in _MOCK_TEMPLATES[:num_results]
         ]
-        
-        return mock_articles[:num_results]
 
 
-# Global Serper service instance
-serper_service = SerperService()
+@lru_cache()
+def get_serper_service() -> SerperService:
+    """Get the shared Serper service, created on first use."""
+    return SerperService()
@@ -0,0 +1,64 @@
+"""In-process TTL cache for user rows read on hot request paths."""
+import threading
+from typing import List, NamedTuple, Optional
+
+from cachetools import TTLCache
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import User
+
+
+class CachedUser(NamedTuple):
+    """Detached snapshot of the user columns the routes read."""
+    id: int
+    email: str
+    interests: List[str]
+    reading_level: str
+    subscription_status: str
+
+
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_lock = threading.Lock()
+
+
+async def get_cached_user(db: AsyncSession, user_id: int) -> Optional[CachedUser]:
+    """
+    Get a user by ID, consulting the TTL cache before the database.
+    
+    Args:
+        db: Database session
+        user_id: User ID
+        
+    Returns:
+        Cached user snapshot or None if the user does not exist
+    """
+    with _lock:
+        cached = _user_cache.get(user_id)
+    if cached is not None:
+        return cached
+    
+    user = await db.get(User, user_id)
+    if not user:
+        return None
+    
+    cached = CachedUser(
+        id=user.id,
+        email=user.email,
+        interests=user.interests,
+        reading_level=user.reading_level.value,
+        subscription_status=user.subscription_status.value
+    )
+    with _lock:
+        _user_cache[user_id] = cached
+    return cached
+
+
+def invalidate_user(user_id: int):
+    """
+    Drop a user from the cache.
+    
+    Args:
+        user_id: User ID
+    """
+    with _lock:
+        _user_cache.pop(user_id, None)
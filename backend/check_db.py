@@ -1,5 +1,5 @@
 """Quick database setup and test script."""
-import pymysql
+import MySQLdb
 import sys
 import os
 
@@ -17,11 +17,11 @@ print(f"User: {settings.MYSQL_USER}")
 
 try:
     # Connect without selecting a database
-    connection = pymysql.connect(
+    connection = MySQLdb.connect(
         host=settings.MYSQL_HOST,
         port=settings.MYSQL_PORT,
         user=settings.MYSQL_USER,
-        password=settings.MYSQL_PASSWORD
+        passwd=settings.MYSQL_PASSWORD
     )
     
     print("✅ MySQL connection successful!")
@@ -31,11 +31,11 @@ try:
         cursor.execute("CREATE DATABASE IF NOT EXISTS newsletter_db")
         print("✅ Database 'newsletter_db' created/verified!")
         
-        # Use the database
-        cursor.execute("USE newsletter_db")
-        
-        # Show tables
-        cursor.execute("SHOW TABLES")
+        # List tables in one query without switching databases
+        cursor.execute(
+            "SELECT TABLE_NAME FROM information_schema.tables WHERE table_schema = %s",
+            ("newsletter_db",)
+        )
         tables = cursor.fetchall()
         
         if tables:
@@ -12,15 +12,11 @@ from sqlalchemy import text
 print("🚀 Initializing database tables...")
 
 try:
-    # Drop all tables first to ensure clean state
-    with engine.connect() as conn:
+    # Drop all tables first to ensure clean state (one DROP, one transaction)
+    with engine.begin() as conn:
         conn.execute(text("SET FOREIGN_KEY_CHECKS = 0"))
-        conn.execute(text("DROP TABLE IF EXISTS user_feedback"))
-        conn.execute(text("DROP TABLE IF EXISTS faiss_embeddings"))
-        conn.execute(text("DROP TABLE IF EXISTS articles"))
-        conn.execute(text("DROP TABLE IF EXISTS users"))
+        conn.execute(text("DROP TABLE IF EXISTS user_feedback, faiss_embeddings, articles, users"))
         conn.execute(text("SET FOREIGN_KEY_CHECKS = 1"))
-        conn.commit()
     
     print("✅ Dropped existing tables")
     
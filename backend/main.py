@@ -1,12 +1,20 @@
 """Main FastAPI application."""
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from loguru import logger
+import asyncio
+import httpx
 import sys
 
 from app.config import get_settings
-from app.database import init_db
+from app.database import async_engine, init_db
 from app.routes import router
+from app.services.faiss_service import faiss_service
+from app.services.groq_service import groq_service
+from app.services.resend_service import get_resend_service
+from app.services.serper_service import get_serper_service
 
 settings = get_settings()
 
@@ -15,22 +23,65 @@ logger.remove()
 logger.add(
     sys.stdout,
     format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> | <level>{message}</level>",
-    level="INFO" if not settings.DEBUG else "DEBUG"
+    level="INFO" if not settings.DEBUG else "DEBUG",
+    enqueue=True
 )
+# Records are written by loguru's background thread, off the request path
 logger.add(
     "logs/app.log",
     rotation="500 MB",
     retention="10 days",
-    level="INFO"
+    compression="gz",
+    level="INFO",
+    enqueue=True
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize application on startup and clean up on shutdown."""
+    logger.info("Starting Newsletter AI application...")
+    
+    # Initialize database on a worker thread so the event loop stays free
+    try:
+        await asyncio.to_thread(init_db)
+        logger.info("Database initialized successfully")
+    except Exception as e:
+        logger.error(f"Failed to initialize database: {e}")
+        raise
+    
+    # Load the embedding model now rather than on the first search
+    await asyncio.to_thread(faiss_service.warm_up)
+    
+    # One pooled HTTP client for outbound calls made from request handlers
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=10,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    )
+    
+    logger.info("Application startup complete")
+    
+    yield
+    
+    logger.info("Shutting down Newsletter AI application...")
+    await app.state.http.aclose()
+    await get_serper_service().aclose()
+    await groq_service.aclose()
+    await get_resend_service().aclose()
+    get_resend_service().session.close()
+    await async_engine.dispose()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Newsletter AI API",
     description="AI-powered newsletter generation with semantic search and personalization",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -46,28 +97,6 @@ app.add_middleware(
 app.include_router(router, prefix="/api/v1", tags=["Newsletter"])
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize application on startup."""
-    logger.info("Starting Newsletter AI application...")
-    
-    # Initialize database
-    try:
-        init_db()
-        logger.info("Database initialized successfully")
-    except Exception as e:
-        logger.error(f"Failed to initialize database: {e}")
-        raise
-    
-    logger.info("Application startup complete")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on application shutdown."""
-    logger.info("Shutting down Newsletter AI application...")
-
-
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -80,11 +109,15 @@ async def root():
 
 
 if __name__ == "__main__":
+    import importlib.util
     import uvicorn
     
+    # libuv event loop and the C HTTP parser where available (not on Windows)
     uvicorn.run(
         "main:app",
         host=settings.API_HOST,
         port=settings.API_PORT,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11"
     )
@@ -1,12 +1,20 @@
 """Simplified FastAPI app for Phase 1 MVP - Signup, News Fetching, Search, Feedback."""
-from fastapi import FastAPI, Depends, HTTPException, status, Query
+from fastapi import FastAPI, BackgroundTasks, Depends, HTTPException, status, Query
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session, load_only
 from loguru import logger
-import json
+import anyio
+import asyncio
+import heapq
+import time
+import weakref
 import numpy as np
-import requests
-import pickle
+from scipy import sparse
+import re
+from collections import Counter
 from pathlib import Path
 
 from app.database import get_db, init_db, SessionLocal
@@ -17,42 +25,124 @@ from app.schemas import (
     SearchRequest, SearchResponse
 )
 from app.config import get_settings
-from app.services.serper_service import serper_service
+from app.services.serper_service import get_serper_service
 from app.services.groq_service import groq_service
 from app.services.faiss_service import faiss_service
 from app.services.fact_check_service import fact_check_service
+from app.services.redis_service import redis_service
 
 settings = get_settings()
-FAISS_INDEX_PATH = Path(__file__).resolve().parent / "data" / "faiss" / "faiss_index.pkl"
-
-
-def _simple_fact_check(text: str) -> str:
+# Sync DB endpoints run on AnyIO's worker threads; the default of 40 caps concurrency
+THREADPOOL_SIZE = 100
+RECOMMENDATIONS_CACHE_TTL = 300
+# Reciprocal-rank-fusion damping constant for content recommendations
+RRF_K = 60
+SEARCH_CACHE_TTL = 300
+# One lock per in-flight search key; entries vanish once no request holds them
+_search_locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+FAISS_INDEX_PATH = Path(__file__).resolve().parent / "data" / "faiss" / "faiss_index.index"
+# Index written by earlier versions; still loaded if no native index exists yet
+LEGACY_FAISS_INDEX_PATH = FAISS_INDEX_PATH.with_suffix(".pkl")
+# Raw vectors kept apart from the index so a new index type needs no re-embedding
+EMBEDDINGS_CACHE_PATH = FAISS_INDEX_PATH.with_name("embeddings.npy")
+
+
+async def _simple_fact_check(text: str) -> str:
     """Use real fact-check service or fallback to heuristic."""
     if not text:
         return "unknown"
     try:
-        result = fact_check_service.check_article(text)
+        result = await fact_check_service.check_article(text)
         return result.get("overall_status", "unknown")
     except Exception as e:
         logger.warning(f"Fact check failed: {e}")
         return "unknown"
 
 
+# Bias keywords by side, matched in a single case-insensitive pass
+_BIAS_KEYWORDS = {
+    # Left-leaning keywords
+    "left": ["progressive", "climate", "inequality", "social justice", "regulation", "fair wage", "labor rights"],
+    # Right-leaning keywords
+    "right": ["market", "tax cut", "deregulation", "business", "entrepreneur", "conservative", "free market"],
+    # Neutral keywords
+    "neutral": ["technology", "innovation", "research", "study", "data", "report", "analysis"],
+}
+_BIAS_SIDES = {kw: side for side, keywords in _BIAS_KEYWORDS.items() for kw in keywords}
+# Longest first so multi-word phrases win over their single-word parts
+_BIAS_RE = re.compile(
+    r"\b(" + "|".join(map(re.escape, sorted(_BIAS_SIDES, key=len, reverse=True))) + r")\b",
+    re.IGNORECASE
+)
+
+
+def _summary_text(raw_summary) -> str:
+    """Flatten a Groq summary result into bullet-point text."""
+    if isinstance(raw_summary, dict) and raw_summary.get("summary"):
+        bullet_points = raw_summary["summary"]
+        if isinstance(bullet_points, list):
+            return "\n".join([f"• {pt}" for pt in bullet_points])
+        return str(bullet_points)
+    return str(raw_summary)
+
+
+async def _enrich_snippet(snippet: str) -> tuple:
+    """Summarize and fact-check a snippet concurrently; returns (summary, fact_status)."""
+    raw_summary, fact_result = await asyncio.gather(
+        groq_service.summarize_async(snippet),
+        fact_check_service.check_article(snippet),
+        return_exceptions=True
+    )
+    if isinstance(raw_summary, Exception):
+        logger.warning(f"Groq summarization failed: {raw_summary}")
+        summary = snippet[:200]
+    else:
+        summary = _summary_text(raw_summary)
+    if isinstance(fact_result, Exception):
+        logger.warning(f"Fact-check failed: {fact_result}")
+        fact_status = "unknown"
+    else:
+        fact_status = fact_result.get("overall_status", "unknown")
+    return summary, fact_status
+
+
+async def _enrich_articles(article_ids: list):
+    """Summarize and fact-check stored articles in the background, in their own session."""
+    session = SessionLocal()
+    try:
+        articles = await run_in_threadpool(
+            lambda: session.query(Article).filter(Article.id.in_(article_ids)).all()
+        )
+        enriched = await asyncio.gather(*(_enrich_snippet(a.content or "") for a in articles))
+        for article, (summary, fact_status) in zip(articles, enriched):
+            article.summary = summary
+            article.fact_check_status = fact_status
+        await run_in_threadpool(session.commit)
+        logger.info(f"✅ Enriched {len(articles)} articles in the background")
+    except Exception as exc:
+        session.rollback()
+        logger.warning(f"Background enrichment failed: {exc}")
+    finally:
+        session.close()
+
+
+def _existing_articles_by_url(db: Session, urls) -> dict:
+    """Load already-stored articles for the given URLs in one IN query."""
+    urls = {url for url in urls if url}
+    if not urls:
+        return {}
+    return {a.url: a for a in db.query(Article).filter(Article.url.in_(urls)).all()}
+
+
 def _simple_bias(text: str) -> tuple:
     """Rough bias scorer; produces varied scores for testing."""
     if not text:
         return 0.0, "No content to score"
-    lowered = text.lower()
-    # Left-leaning keywords
-    left_keywords = ["progressive", "climate", "inequality", "social justice", "regulation", "fair wage", "labor rights"]
-    # Right-leaning keywords
-    right_keywords = ["market", "tax cut", "deregulation", "business", "entrepreneur", "conservative", "free market"]
-    # Neutral keywords
-    neutral_keywords = ["technology", "innovation", "research", "study", "data", "report", "analysis"]
-    
-    left_score = sum(lowered.count(kw) for kw in left_keywords)
-    right_score = sum(lowered.count(kw) for kw in right_keywords)
-    neutral_score = sum(lowered.count(kw) for kw in neutral_keywords)
+    # One pass over the text, tallying each matched keyword's side
+    counts = Counter(_BIAS_SIDES[m.group(1).lower()] for m in _BIAS_RE.finditer(text))
+    left_score = counts["left"]
+    right_score = counts["right"]
+    neutral_score = counts["neutral"]
     
     total = left_score + right_score + neutral_score
     if total == 0:
@@ -73,25 +163,62 @@ def _simple_bias(text: str) -> tuple:
 
 
 def _persist_faiss_index():
-    """Persist FAISS index to disk under backend/data/faiss/faiss_index.pkl."""
+    """Persist FAISS index to disk under backend/data/faiss/faiss_index.index."""
     try:
         FAISS_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
         faiss_service.save_index(str(FAISS_INDEX_PATH))
+        faiss_service.save_embeddings(str(EMBEDDINGS_CACHE_PATH))
         logger.info(f"FAISS index saved to {FAISS_INDEX_PATH}")
     except Exception as exc:
         logger.warning(f"Failed to persist FAISS index: {exc}")
 
 
+def _migrate_legacy_embeddings():
+    """Rewrite pickled or float32 embedding rows in the compact packed format, once."""
+    packed_size = 4 + faiss_service.dimension
+    session = SessionLocal()
+    try:
+        rows = (
+            session.query(FAISSEmbedding)
+            .filter(func.length(FAISSEmbedding.embedding_vector) != packed_size)
+            .all()
+        )
+        for row in rows:
+            row.embedding_vector = faiss_service.pack_embedding(
+                faiss_service.unpack_embedding(row.embedding_vector)
+            )
+        if rows:
+            session.commit()
+            logger.info(f"Migrated {len(rows)} legacy embeddings to the packed format")
+    except Exception as exc:
+        session.rollback()
+        logger.warning(f"Skipping legacy embedding migration: {exc}")
+    finally:
+        session.close()
+
+
 def _load_faiss_index():
     """Load FAISS index from disk, else rebuild from DB embeddings."""
-    # Prefer on-disk index for fast startup
-    if FAISS_INDEX_PATH.exists():
+    # Prefer on-disk index for fast startup. Loaded writable (no mmap):
+    # /generate_embeddings appends to it later
+    for path in (FAISS_INDEX_PATH, LEGACY_FAISS_INDEX_PATH):
+        if not path.exists():
+            continue
         try:
-            faiss_service.load_index(str(FAISS_INDEX_PATH))
-            logger.info(f"FAISS index loaded from {FAISS_INDEX_PATH}")
+            faiss_service.load_index(str(path), mmap=False)
+            logger.info(f"FAISS index loaded from {path}")
+            return
+        except Exception as exc:
+            logger.warning(f"Failed to load FAISS index from {path}: {exc}")
+    # Next best: rebuild the index from the cached vectors, skipping the DB decode
+    if EMBEDDINGS_CACHE_PATH.exists():
+        try:
+            faiss_service.load_embeddings(str(EMBEDDINGS_CACHE_PATH))
+            _persist_faiss_index()
             return
         except Exception as exc:
-            logger.warning(f"Failed to load FAISS index from disk, will rebuild from DB: {exc}")
+            logger.warning(f"Failed to rebuild FAISS index from {EMBEDDINGS_CACHE_PATH}: {exc}")
+    logger.info("No usable FAISS index on disk, rebuilding from DB")
     # Fallback: rebuild from stored per-article embeddings in DB
     session = SessionLocal()
     try:
@@ -125,9 +252,21 @@ app.add_middleware(
 async def startup_event():
     """Initialize database on startup."""
     logger.info("🚀 Starting Newsletter AI - Phase 1 MVP")
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
     init_db()
     logger.info("✅ Database initialized")
+    _migrate_legacy_embeddings()
     _load_faiss_index()
+    # Load the embedding model now rather than on the first search
+    await run_in_threadpool(faiss_service.warm_up)
+
+# Shutdown event
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close shared HTTP clients on shutdown."""
+    await fact_check_service.aclose()
+    await get_serper_service().aclose()
+    await groq_service.aclose()
 
 # Health check
 @app.get("/api/v1/health")
@@ -137,7 +276,7 @@ async def health_check():
 
 # Signup endpoint
 @app.post("/api/v1/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
+def signup(user_data: UserCreate, db: Session = Depends(get_db)):
     """Create a new user account."""
     try:
         # Check if user already exists
@@ -151,7 +290,7 @@ async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
         # Create new user
         new_user = User(
             email=user_data.email,
-            interests=json.dumps(user_data.interests),
+            interests=user_data.interests,
             reading_level=user_data.reading_level
         )
         
@@ -161,16 +300,8 @@ async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
         
         logger.info(f"New user created: {new_user.email}")
         
-        # Format response
-        response = UserResponse(
-            id=new_user.id,
-            email=new_user.email,
-            interests=json.loads(new_user.interests),
-            reading_level=new_user.reading_level.value,
-            subscription_status=new_user.subscription_status.value
-        )
-        
-        return response
+        # response_model converts the ORM row in a single validation pass
+        return new_user
         
     except HTTPException:
         raise
@@ -184,7 +315,7 @@ async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
 
 # Login endpoint
 @app.post("/api/v1/login", response_model=UserResponse)
-async def login(user_data: UserLogin, db: Session = Depends(get_db)):
+def login(user_data: UserLogin, db: Session = Depends(get_db)):
     """Login an existing user."""
     try:
         # Find user by email
@@ -198,16 +329,8 @@ async def login(user_data: UserLogin, db: Session = Depends(get_db)):
         
         logger.info(f"User logged in: {user.email}")
         
-        # Format response
-        response = UserResponse(
-            id=user.id,
-            email=user.email,
-            interests=json.loads(user.interests),
-            reading_level=user.reading_level.value,
-            subscription_status=user.subscription_status.value
-        )
-        
-        return response
+        # response_model converts the ORM row in a single validation pass
+        return user
         
     except HTTPException:
         raise
@@ -245,52 +368,62 @@ async def fetch_news(
         
         if user_id:
             # Fetch user and their interests
-            user = db.query(User).filter(User.id == user_id).first()
+            user = db.query(User).options(load_only(User.interests)).filter(User.id == user_id).first()
             if not user:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="User not found"
                 )
             
-            interests = json.loads(user.interests)
+            interests = user.interests
             articles_per_interest = max(1, limit // len(interests)) if interests else limit
-            articles_data = serper_service.fetch_news_by_interests(interests, articles_per_interest)
+            articles_data = await get_serper_service().fetch_news_by_interests(interests, articles_per_interest)
         elif query:
-            articles_data = serper_service.fetch_news(query, limit)
+            articles_data = await get_serper_service().fetch_news(query, limit)
         else:
-            articles_data = serper_service.fetch_news("technology news", limit)
+            articles_data = await get_serper_service().fetch_news("technology news", limit)
         
-        # Store articles in database (avoid duplicates)
-        stored_articles = []
+        existing_by_url = _existing_articles_by_url(db, (a["url"] for a in articles_data))
+        # Only the first occurrence of a new URL is inserted
+        unseen = {}
         for article_data in articles_data:
-            existing = db.query(Article).filter(Article.url == article_data["url"]).first()
-            
-            if not existing:
-                fact_status = None
-                bias_score = None
-                bias_explanation = None
-                if apply_fact_check:
-                    fact_status = _simple_fact_check(article_data.get("content", ""))
-                    bias_score, bias_explanation = _simple_bias(article_data.get("content", ""))
-                new_article = Article(
-                    title=article_data["title"],
-                    url=article_data["url"],
-                    content=article_data["content"],
-                    source=article_data["source"],
-                    fact_check_status=fact_status,
-                    bias_score=bias_score,
-                    bias_explanation=bias_explanation
-                )
-                db.add(new_article)
-                db.commit()
-                db.refresh(new_article)
-                stored_articles.append(new_article)
-            else:
-                stored_articles.append(existing)
+            if article_data["url"] not in existing_by_url:
+                unseen.setdefault(article_data["url"], article_data)
+        new_data = list(unseen.values())
+        
+        # Fact-check the new articles concurrently rather than one by one
+        fact_statuses = [None] * len(new_data)
+        if apply_fact_check:
+            fact_statuses = await asyncio.gather(
+                *(_simple_fact_check(a.get("content", "")) for a in new_data)
+            )
+        
+        # Store new articles in one batch (avoid duplicates)
+        new_articles = []
+        for article_data, fact_status in zip(new_data, fact_statuses):
+            bias_score = None
+            bias_explanation = None
+            if apply_fact_check:
+                bias_score, bias_explanation = _simple_bias(article_data.get("content", ""))
+            new_articles.append(Article(
+                title=article_data["title"],
+                url=article_data["url"],
+                content=article_data["content"],
+                source=article_data["source"],
+                summary=None,
+                fact_check_status=fact_status,
+                bias_score=bias_score,
+                bias_explanation=bias_explanation
+            ))
+        if new_articles:
+            db.add_all(new_articles)
+            db.flush()
+            existing_by_url.update((a.url, a) for a in new_articles)
+        stored_articles = list({a["url"]: existing_by_url[a["url"]] for a in articles_data}.values())
         
         logger.info(f"✅ Fetched {len(stored_articles)} articles")
         
-        return {
+        response = {
             "articles": [
                 {
                     "id": a.id,
@@ -307,6 +440,9 @@ async def fetch_news(
             ],
             "total": len(stored_articles)
         }
+        # Commit after serializing so the expired rows are not reloaded one by one
+        db.commit()
+        return response
         
     except HTTPException:
         raise
@@ -340,7 +476,7 @@ async def summarize(article_id: int, db: Session = Depends(get_db)):
             )
         
         # Use Groq to summarize (with graceful fallback)
-        summary = groq_service.summarize(article.content, "intermediate") if article.content else article.content[:200]
+        summary = await groq_service.summarize_async(article.content, "intermediate") if article.content else article.content[:200]
         
         # Update article with summary
         article.summary = summary
@@ -365,14 +501,20 @@ async def summarize(article_id: int, db: Session = Depends(get_db)):
 
 
 # Helper function to calculate relevance score (Google-like matching)
-def _calculate_relevance_score(article: Article, query: str) -> float:
+def _query_keywords(query: str) -> list:
+    """Split a search query into lowercase keywords, once per request."""
+    return [k.strip() for k in query.lower().split() if k.strip()]
+
+
+def _calculate_relevance_score(article: Article, keywords: list) -> float:
     """
     Calculate relevance score like Google - stricter matching.
     Only returns articles that actually contain the search terms.
-    """
-    query_lower = query.lower()
-    keywords = [k.strip() for k in query_lower.split() if k.strip()]
     
+    Args:
+        article: Article to score
+        keywords: Query keywords from _query_keywords
+    """
     if not keywords:
         return 0.0
     
@@ -380,48 +522,144 @@ def _calculate_relevance_score(article: Article, query: str) -> float:
     content_lower = (article.content or "").lower()
     source_lower = (article.source or "").lower()
     
-    score = 0.0
-    matched_keywords = 0
-    
-    # Count how many keywords appear in title
-    title_matches = sum(1 for keyword in keywords if keyword in title_lower)
-    
-    # Count how many keywords appear anywhere
-    total_matches = sum(1 for keyword in keywords if keyword in title_lower or keyword in content_lower or keyword in source_lower)
+    # One pass over the keywords, checking each field once
+    title_matches = content_matches = source_matches = total_matches = 0
+    for keyword in keywords:
+        in_title = keyword in title_lower
+        in_content = keyword in content_lower
+        in_source = keyword in source_lower
+        title_matches += in_title
+        content_matches += in_content
+        source_matches += in_source
+        total_matches += in_title or in_content or in_source
     
     # Only return articles where at least one keyword matches AND
     # at least 50% of keywords are found across all fields
     if total_matches == 0:
         return 0.0  # No match at all
     
-    match_ratio = total_matches / len(keywords)
-    
-    if match_ratio < 0.5:  # Less than 50% keywords matched
+    if total_matches / len(keywords) < 0.5:  # Less than 50% keywords matched
         return 0.0
     
-    # Scoring: title matches weighted heavily
-    score += title_matches * 10
+    # Scoring: title matches weighted heavily, content/source lower
+    return float(title_matches * 10 + content_matches * 2 + source_matches * 3)
+
+
+def _search_response(query: str, final_results: list) -> dict:
+    """Shape ranked search results into the search_articles response."""
+    response = {
+        "query": query,
+        "articles": [
+            {
+                "id": a.id,
+                "title": a.title,
+                "url": a.url,
+                "summary": a.summary or a.content[:200],
+                "source": a.source,
+                "bias_score": a.bias_score or 0.5,
+                "fact_check_status": a.fact_check_status,
+                "bias_explanation": a.bias_explanation,
+                "deep_dive_content": a.deep_dive_content
+            }
+            for a in final_results
+        ],
+        "total": len(final_results)
+    }
+    
+    if len(final_results) == 0:
+        response["message"] = f"No relevant articles found for '{query}'."
+    
+    return response
+
+
+async def _search_fresh(query: str, limit: int, db: Session) -> tuple:
+    """Fetch and store Serper results; returns (top articles by relevance, new article IDs)."""
+    # Step 1: Fetch fresh articles from Serper API
+    try:
+        news_items = await get_serper_service().fetch_news(query, limit)
+        logger.info(f"📰 Serper API returned {len(news_items)} fresh articles")
+    except Exception as e:
+        logger.error(f"Serper API failed: {e}")
+        news_items = []
+    
+    # Step 2: Reuse stored articles; new ones are enriched after the response
+    existing_by_url = _existing_articles_by_url(db, (item.get("url") for item in news_items))
+    new_articles = list(existing_by_url.values())
+    unseen = {}
+    for item in news_items:
+        if item.get("url", "") not in existing_by_url:
+            unseen.setdefault(item.get("url", ""), item)
+    pending = list(unseen.values())
+    
+    batch = []
+    for item in pending:
+        # Extract article data
+        title = item.get("title") or "Untitled"
+        url = item.get("url", "")
+        snippet = item.get("content", "")
+        source = item.get("source") or "Unknown"
+        
+        # Calculate bias score
+        bias_score, _ = _simple_bias(snippet)
+        bias_label = "balanced" if abs(bias_score) < 0.3 else ("slightly biased" if abs(bias_score) < 0.6 else "biased")
+        bias_explanation = f"{bias_label.capitalize()}: {bias_score:.2f}"
+        
+        batch.append(Article(
+            title=title,
+            url=url,
+            content=snippet,
+            summary=snippet[:200],
+            source=source,
+            bias_score=bias_score,
+            bias_explanation=bias_explanation,
+            fact_check_status="pending",
+            deep_dive_content=None
+        ))
     
-    # Content/source matches weighted lower
-    content_matches = sum(1 for keyword in keywords if keyword in content_lower)
-    source_matches = sum(1 for keyword in keywords if keyword in source_lower)
+    # Insert all new articles in one flush instead of a commit per row
+    stored = []
+    if batch:
+        try:
+            db.add_all(batch)
+            db.flush()
+            new_articles.extend(batch)
+            stored = batch
+            logger.info(f"✅ Stored {len(batch)} new articles")
+        except Exception as e:
+            logger.error(f"Failed to store new articles: {e}")
+            db.rollback()
     
-    score += content_matches * 2
-    score += source_matches * 3
+    # Step 3: Filter by relevance
+    keywords = _query_keywords(query)
+    relevant_articles = []
+    for article in new_articles:
+        score = _calculate_relevance_score(article, keywords)
+        if score > 0:
+            relevant_articles.append((article, score))
     
-    return score
+    # Keep only the top `limit` by relevance without sorting the rest
+    final_results = [a for a, _ in heapq.nlargest(limit, relevant_articles, key=lambda x: x[1])]
+    return final_results, [a.id for a in stored]
 
 
 # Search articles (Real-time fetch from Serper API)
 @app.post("/api/v1/search_articles")
-async def search_articles(search_data: SearchRequest, db: Session = Depends(get_db)):
+async def search_articles(
+    search_data: SearchRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
     """
     Real-time search - fetches fresh articles from Serper API.
     1. Fetches latest articles from Serper for the search query
     2. Stores new articles in database
-    3. Applies bias scoring and fact-checking
+    3. Applies bias scoring; Groq summaries and fact-checks of new
+       articles run as a background task after the response
     4. Returns only relevant results
     
+    Result IDs are cached for SEARCH_CACHE_TTL seconds, and identical
+    concurrent queries wait on one Serper round trip.
+    
     Args:
         search_data: Search query and user preferences
         db: Database session
@@ -441,113 +679,29 @@ async def search_articles(search_data: SearchRequest, db: Session = Depends(get_
                 "message": "Please enter at least 2 characters"
             }
         
-        logger.info(f"🔍 Real-time search for: '{query}'")
-        
-        # Step 1: Fetch fresh articles from Serper API
-        try:
-            serper_results = serper_service.search_news(query, num=limit)
-            news_items = serper_results.get("news", [])
-            logger.info(f"📰 Serper API returned {len(news_items)} fresh articles")
-        except Exception as e:
-            logger.error(f"Serper API failed: {e}")
-            news_items = []
-        
-        # Step 2: Process and store new articles
-        new_articles = []
-        for item in news_items:
-            try:
-                # Check if article already exists
-                existing = db.query(Article).filter(Article.url == item.get("link")).first()
-                if existing:
-                    new_articles.append(existing)
-                    continue
-                
-                # Extract article data
-                title = item.get("title", "Untitled")
-                url = item.get("link", "")
-                snippet = item.get("snippet", "")
-                source = item.get("source", "Unknown")
-                
-                # Generate summary with Groq
-                try:
-                    summary = groq_service.summarize(snippet)
-                except Exception as e:
-                    logger.warning(f"Groq summarization failed: {e}")
-                    summary = snippet[:200]
-                
-                # Calculate bias score
-                bias_score = _simple_bias(snippet)
-                bias_label = "balanced" if abs(bias_score) < 0.3 else ("slightly biased" if abs(bias_score) < 0.6 else "biased")
-                bias_explanation = f"{bias_label.capitalize()}: {bias_score:.2f}"
-                
-                # Fact-check the article
-                try:
-                    fact_result = fact_check_service.check_article(snippet)
-                    fact_status = fact_result.get("overall_status", "unknown")
-                except Exception as e:
-                    logger.warning(f"Fact-check failed: {e}")
-                    fact_status = "unknown"
-                
-                # Create new article
-                article = Article(
-                    title=title,
-                    url=url,
-                    content=snippet,
-                    summary=summary,
-                    source=source,
-                    bias_score=bias_score,
-                    bias_explanation=bias_explanation,
-                    fact_check_status=fact_status
-                )
-                
-                db.add(article)
-                db.commit()
-                db.refresh(article)
-                
-                new_articles.append(article)
-                logger.info(f"✅ Stored new article: {title[:50]}...")
-                
-            except Exception as e:
-                logger.error(f"Failed to process article: {e}")
-                db.rollback()
-                continue
-        
-        # Step 3: Filter by relevance
-        relevant_articles = []
-        for article in new_articles:
-            score = _calculate_relevance_score(article, query)
-            if score > 0:
-                relevant_articles.append((article, score))
-        
-        # Sort by relevance
-        relevant_articles.sort(key=lambda x: x[1], reverse=True)
-        final_results = [a for a, _ in relevant_articles[:limit]]
-        
-        logger.info(f"✅ Returning {len(final_results)} relevant articles for: '{query}'")
-        
-        response = {
-            "query": query,
-            "articles": [
-                {
-                    "id": a.id,
-                    "title": a.title,
-                    "url": a.url,
-                    "summary": a.summary or a.content[:200],
-                    "source": a.source,
-                    "bias_score": a.bias_score or 0.5,
-                    "fact_check_status": a.fact_check_status,
-                    "bias_explanation": a.bias_explanation,
-                    "deep_dive_content": a.deep_dive_content
-                }
-                for a in final_results
-            ],
-            "total": len(final_results)
-        }
-        
-        if len(final_results) == 0:
-            response["message"] = f"No relevant articles found for '{query}'."
-        
-        return response
+        cache_key = redis_service.get_cache_key("search_articles", query=query.lower().strip(), limit=limit)
+        lock = _search_locks.setdefault(cache_key, asyncio.Lock())
+        async with lock:
+            cached_ids = redis_service.get(cache_key)
+            if cached_ids is not None:
+                by_id = {a.id: a for a in db.query(Article).filter(Article.id.in_(cached_ids)).all()}
+                logger.info(f"⚡ Cached search results for: '{query}'")
+                return _search_response(query, [by_id[i] for i in cached_ids if i in by_id])
+            
+            logger.info(f"🔍 Real-time search for: '{query}'")
+            final_results, new_ids = await _search_fresh(query, limit, db)
+            
+            logger.info(f"✅ Returning {len(final_results)} relevant articles for: '{query}'")
+            
+            response = _search_response(query, final_results)
+            
+            # Commit after serializing so the expired rows are not reloaded one by one
+            db.commit()
+            if new_ids:
+                background_tasks.add_task(_enrich_articles, new_ids)
+            if final_results:
+                redis_service.set(cache_key, [a.id for a in final_results], ttl=SEARCH_CACHE_TTL)
+            return response
         
     except Exception as e:
         logger.error(f"Search failed: {e}")
@@ -559,26 +713,26 @@ async def search_articles(search_data: SearchRequest, db: Session = Depends(get_
 
 # Generate embeddings for stored articles and rebuild FAISS index
 @app.post("/api/v1/generate_embeddings")
-async def generate_embeddings(limit: int = Query(50), db: Session = Depends(get_db)):
+def generate_embeddings(limit: int = Query(50), db: Session = Depends(get_db)):
     try:
-        articles = db.query(Article).limit(limit).all()
-        vectors = []
-        ids = []
-        for art in articles:
-            if not art.content:
-                continue
-            embedding = faiss_service.generate_embedding(art.content)
-            vectors.append(embedding)
-            ids.append(art.id)
-            # Persist per-article embedding for reloads
-            existing = db.query(FAISSEmbedding).filter(FAISSEmbedding.article_id == art.id).first()
-            payload = pickle.dumps(embedding)
-            if existing:
-                existing.embedding_vector = payload
-            else:
-                db.add(FAISSEmbedding(article_id=art.id, embedding_vector=payload))
-        if vectors:
-            matrix = np.vstack(vectors).astype("float32")
+        articles = [art for art in db.query(Article).limit(limit).all() if art.content]
+        ids = [art.id for art in articles]
+        if articles:
+            # One batched forward pass instead of one per article
+            matrix = faiss_service.generate_embeddings_batch([art.content for art in articles])
+            # Persist per-article embeddings for reloads: update existing rows, add the rest in bulk
+            existing = {
+                row.article_id: row
+                for row in db.query(FAISSEmbedding).filter(FAISSEmbedding.article_id.in_(ids)).all()
+            }
+            new_rows = []
+            for article_id, embedding in zip(ids, matrix):
+                payload = faiss_service.pack_embedding(embedding)
+                if article_id in existing:
+                    existing[article_id].embedding_vector = payload
+                else:
+                    new_rows.append(FAISSEmbedding(article_id=article_id, embedding_vector=payload))
+            db.add_all(new_rows)
             faiss_service.add_embeddings(matrix, ids)
             _persist_faiss_index()
         db.commit()
@@ -589,78 +743,125 @@ async def generate_embeddings(limit: int = Query(50), db: Session = Depends(get_
 
 
 def _content_based_recs(user_id: int, top_k: int, db: Session):
-    liked = db.query(UserFeedback).filter(UserFeedback.user_id == user_id, UserFeedback.rating >= 4).all()
+    liked_ids = db.query(UserFeedback.article_id).filter(UserFeedback.user_id == user_id, UserFeedback.rating >= 4)
+    # All liked-article embeddings in one IN query, decoded into one matrix
+    rows = [
+        (article_id, blob) for article_id, blob in db.query(FAISSEmbedding.article_id, FAISSEmbedding.embedding_vector)
+        .filter(FAISSEmbedding.article_id.in_(liked_ids.scalar_subquery()))
+        .all()
+        if blob
+    ]
+    if not rows:
+        return []
+    embeddings = np.empty((len(rows), faiss_service.dimension), dtype=np.float32)
+    liked = set()
+    for article_id, blob in rows:
+        try:
+            faiss_service.unpack_embedding(blob, out=embeddings[len(liked)])
+            liked.add(article_id)
+        except Exception:
+            continue
     if not liked:
         return []
-    embeddings = []
-    for fb in liked:
-        emb_row = db.query(FAISSEmbedding).filter(FAISSEmbedding.article_id == fb.article_id).first()
-        if emb_row and emb_row.embedding_vector:
-            try:
-                vec = pickle.loads(emb_row.embedding_vector)
-                embeddings.append(vec)
-            except Exception:
+    # One query per liked article in a single FAISS call, fused by reciprocal rank,
+    # so distinct interests are not blurred into one mean vector
+    per_query = faiss_service.search_by_embeddings(embeddings[:len(liked)], top_k=top_k * 4 + len(liked))
+    fused = {}
+    for results in per_query:
+        rank = 0
+        for article_id, _distance in results:
+            if article_id in liked:
                 continue
-    if not embeddings:
-        return []
-    mean_vec = np.mean(np.vstack(embeddings), axis=0)
-    return faiss_service.search_by_embedding(mean_vec, top_k=top_k)
+            fused[article_id] = fused.get(article_id, 0.0) + 1.0 / (RRF_K + rank)
+            rank += 1
+    return heapq.nlargest(top_k, fused.items(), key=lambda item: item[1])
 
 
 def _collaborative_recs(user_id: int, top_k: int, db: Session):
-    rows = db.query(UserFeedback).all()
+    rows = db.query(UserFeedback.user_id, UserFeedback.article_id, UserFeedback.rating).all()
     if not rows:
         return []
-    users = sorted({r.user_id for r in rows})
-    articles = sorted({r.article_id for r in rows})
-    user_index = {u: i for i, u in enumerate(users)}
-    article_index = {a: i for i, a in enumerate(articles)}
-    if user_id not in user_index:
+    user_ids, article_ids, ratings = (np.asarray(col) for col in zip(*rows))
+    users, user_rows = np.unique(user_ids, return_inverse=True)
+    articles, article_cols = np.unique(article_ids, return_inverse=True)
+    target_row = np.searchsorted(users, user_id)
+    if target_row == len(users) or users[target_row] != user_id:
         return []
-    matrix = np.zeros((len(users), len(articles)))
-    for r in rows:
-        matrix[user_index[r.user_id], article_index[r.article_id]] = r.rating
-    target = matrix[user_index[user_id]]  # shape: (num_articles,)
-    norms = np.linalg.norm(matrix, axis=1) * (np.linalg.norm(target) + 1e-6) + 1e-6
-    sims = (matrix @ target) / norms  # shape: (num_users,)
-    scores_vec = sims @ matrix  # shape: (num_articles,)
+    # Sparse user x article ratings; memory scales with the number of ratings
+    matrix = sparse.csr_matrix(
+        (ratings.astype(np.float64), (user_rows, article_cols)),
+        shape=(len(users), len(articles))
+    )
+    target = matrix[target_row]  # shape: (1, num_articles)
+    row_norms = np.sqrt(matrix.multiply(matrix).sum(axis=1)).A1
+    norms = row_norms * (row_norms[target_row] + 1e-6) + 1e-6
+    sims = (matrix @ target.T).toarray().ravel() / norms  # shape: (num_users,)
+    scores_vec = matrix.T @ sims  # shape: (num_articles,)
     # zero out already-rated articles for this user
-    for r in rows:
-        if r.user_id == user_id and r.article_id in article_index:
-            scores_vec[article_index[r.article_id]] = 0
-    top_indices = scores_vec.argsort()[::-1][:top_k]
-    return [articles[i] for i in top_indices if scores_vec[i] > 0]
+    scores_vec[target.indices] = 0
+    k = min(top_k, len(scores_vec))
+    top_indices = np.argpartition(-scores_vec, k - 1)[:k]
+    top_indices = top_indices[np.argsort(-scores_vec[top_indices])]
+    return [int(articles[i]) for i in top_indices if scores_vec[i] > 0]
+
+
+# Columns for recommendation cards; the content fallback is truncated in SQL so
+# full article bodies never leave the database
+_ARTICLE_CARD_COLUMNS = (
+    Article.id,
+    Article.title,
+    Article.url,
+    func.coalesce(func.nullif(Article.summary, ""), func.substr(Article.content, 1, 200)).label("summary"),
+    Article.source,
+    Article.bias_score,
+    Article.fact_check_status,
+)
+
+
+def _recs_cache_key(user_id: int, k: int) -> str:
+    """Recommendations key scoped to the user's current feedback version."""
+    version = redis_service.get(f"recs_version:{user_id}") or 0
+    return f"recs:{user_id}:{version}:{k}"
 
 
 @app.get("/api/v1/recommendations")
-async def hybrid_recommendations(user_id: int = Query(...), k: int = Query(5, ge=1, le=20), db: Session = Depends(get_db)):
+def hybrid_recommendations(user_id: int = Query(...), k: int = Query(5, ge=1, le=20), db: Session = Depends(get_db)):
     """Hybrid recommendations: 70% FAISS content, 30% collaborative."""
     try:
+        cache_key = _recs_cache_key(user_id, k)
+        cached = redis_service.get(cache_key)
+        if cached is not None:
+            return cached
+        
         content_recs = _content_based_recs(user_id, k, db)
         collab_recs = _collaborative_recs(user_id, k, db)
         # content_recs returns list of tuples; collab list of article ids
         content_ids = [a for a, _dist in content_recs]
         combined = set(content_ids + collab_recs)
         if not combined:
-            articles = db.query(Article).order_by(Article.created_at.desc()).limit(k).all()
+            articles = db.query(*_ARTICLE_CARD_COLUMNS).order_by(Article.created_at.desc()).limit(k).all()
         else:
+            content_set = set(content_ids)
+            collab_set = set(collab_recs)
             scores = {}
             for aid in combined:
                 scores[aid] = 0
-                if aid in content_ids:
+                if aid in content_set:
                     scores[aid] += 0.7
-                if aid in collab_recs:
+                if aid in collab_set:
                     scores[aid] += 0.3
             ranked_ids = sorted(scores.keys(), key=lambda x: scores[x], reverse=True)[:k]
-            articles = db.query(Article).filter(Article.id.in_(ranked_ids)).all()
-        return {
+            # IN returns rows in table order; put them back in score order
+            by_id = {a.id: a for a in db.query(*_ARTICLE_CARD_COLUMNS).filter(Article.id.in_(ranked_ids)).all()}
+            articles = [by_id[aid] for aid in ranked_ids if aid in by_id]
+        result = {
             "user_id": user_id,
             "articles": [
                 {
                     "id": a.id,
                     "title": a.title,
                     "url": a.url,
-                    "summary": a.summary or a.content[:200],
+                    "summary": a.summary,
                     "source": a.source,
                     "bias_score": a.bias_score,
                     "fact_check_status": a.fact_check_status
@@ -669,6 +870,8 @@ async def hybrid_recommendations(user_id: int = Query(...), k: int = Query(5, ge
             ],
             "total": len(articles)
         }
+        redis_service.set(cache_key, result, ttl=RECOMMENDATIONS_CACHE_TTL)
+        return result
     except Exception as e:
         logger.error(f"Failed to generate recommendations: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to generate recommendations: {str(e)}")
@@ -681,15 +884,8 @@ async def deep_dive(article_id: int, db: Session = Depends(get_db)):
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
     try:
-        raw_summary = groq_service.summarize(article.content, "beginner") if article.content else ""
-        if isinstance(raw_summary, dict) and raw_summary.get("summary"):
-            bullet_points = raw_summary["summary"]
-            if isinstance(bullet_points, list):
-                summary = "\n".join([f"• {pt}" for pt in bullet_points])
-            else:
-                summary = str(bullet_points)
-        else:
-            summary = str(raw_summary)
+        raw_summary = await groq_service.summarize_async(article.content, "beginner") if article.content else ""
+        summary = _summary_text(raw_summary)
     except Exception as exc:
         summary = f"Summary unavailable: {str(exc)[:100]}"
     deep_dive_text = summary
@@ -700,7 +896,7 @@ async def deep_dive(article_id: int, db: Session = Depends(get_db)):
 
 # Feedback endpoint
 @app.post("/api/v1/feedback", status_code=status.HTTP_201_CREATED)
-async def submit_feedback(feedback_data: FeedbackCreate, db: Session = Depends(get_db)):
+def submit_feedback(feedback_data: FeedbackCreate, db: Session = Depends(get_db)):
     """
     Submit user feedback (rating) for an article.
     
@@ -727,16 +923,23 @@ async def submit_feedback(feedback_data: FeedbackCreate, db: Session = Depends(g
                 detail="Article not found"
             )
         
-        # Create feedback
-        feedback = UserFeedback(
+        # Create feedback, or update the rating if this user already rated the article
+        upsert = mysql_insert(UserFeedback).values(
             user_id=feedback_data.user_id,
             article_id=feedback_data.article_id,
             rating=feedback_data.rating
         )
-        
-        db.add(feedback)
+        result = db.execute(
+            upsert.on_duplicate_key_update(
+                rating=upsert.inserted.rating,
+                id=func.last_insert_id(UserFeedback.id)
+            )
+        )
         db.commit()
-        db.refresh(feedback)
+        feedback = db.get(UserFeedback, result.lastrowid)
+        
+        # New version -> the user's cached recommendations are no longer addressed
+        redis_service.set(f"recs_version:{feedback_data.user_id}", time.time_ns())
         
         logger.info(f"✅ Feedback created: user {feedback_data.user_id} rated article {feedback_data.article_id} with {feedback_data.rating} stars")
         
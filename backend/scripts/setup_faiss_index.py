@@ -2,11 +2,15 @@
 import sys
 import os
 import json
+import threading
 from pathlib import Path
+from typing import Optional
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import exists, insert
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.orm import Session
 from loguru import logger
 import numpy as np
@@ -18,6 +22,12 @@ from app.config import get_settings
 
 settings = get_settings()
 
+# Articles embedded and committed per round; bounds memory on large backlogs
+EMBEDDING_BATCH_SIZE = 64
+
+# Sample articles seeded by this script, loaded once at import
+_SAMPLE_ARTICLES = tuple(json.loads(Path(__file__).with_name("sample_articles.json").read_text(encoding="utf-8")))
+
 
 def create_sample_articles(db: Session) -> list:
     """
@@ -29,146 +39,104 @@ def create_sample_articles(db: Session) -> list:
     Returns:
         List of created article IDs
     """
-    sample_articles = [
-        {
-            "title": "The Future of Artificial Intelligence in Healthcare",
-            "url": "https://example.com/ai-healthcare-1",
-            "content": "Artificial intelligence is revolutionizing healthcare with advanced diagnostics, personalized treatment plans, and predictive analytics. Machine learning algorithms can now detect diseases earlier than traditional methods.",
-            "source": "TechNews"
-        },
-        {
-            "title": "Climate Change: Latest Research and Findings",
-            "url": "https://example.com/climate-change-1",
-            "content": "New research shows accelerating impacts of climate change on global ecosystems. Scientists warn of urgent need for action to reduce carbon emissions and transition to renewable energy sources.",
-            "source": "ScienceDaily"
-        },
-        {
-            "title": "Breakthrough in Quantum Computing",
-            "url": "https://example.com/quantum-computing-1",
-            "content": "Researchers achieve quantum supremacy with new processor design. The breakthrough could revolutionize cryptography, drug discovery, and complex simulations beyond classical computing capabilities.",
-            "source": "QuantumTech"
-        },
-        {
-            "title": "Ethics in AI Development",
-            "url": "https://example.com/ai-ethics-1",
-            "content": "As AI systems become more prevalent, questions about bias, privacy, and accountability grow more urgent. Experts call for comprehensive ethical frameworks and regulatory oversight.",
-            "source": "AI Ethics Journal"
-        },
-        {
-            "title": "Space Exploration: Mars Mission Updates",
-            "url": "https://example.com/mars-mission-1",
-            "content": "Latest data from Mars rovers reveals new evidence of ancient water systems. The findings support theories about past habitability and guide future exploration missions.",
-            "source": "Space News"
-        },
-        {
-            "title": "Renewable Energy Revolution",
-            "url": "https://example.com/renewable-energy-1",
-            "content": "Solar and wind power costs continue to decline, making renewable energy competitive with fossil fuels. Countries worldwide accelerate transition to clean energy infrastructure.",
-            "source": "Energy Today"
-        },
-        {
-            "title": "Advances in Gene Therapy",
-            "url": "https://example.com/gene-therapy-1",
-            "content": "CRISPR technology enables precise genetic modifications to treat inherited diseases. Clinical trials show promising results for previously untreatable conditions.",
-            "source": "Medical Journal"
-        },
-        {
-            "title": "Cybersecurity Threats in 2026",
-            "url": "https://example.com/cybersecurity-1",
-            "content": "AI-powered cyberattacks pose new challenges for digital security. Organizations invest heavily in advanced threat detection and zero-trust architectures.",
-            "source": "CyberSec Weekly"
-        },
-        {
-            "title": "The Impact of Remote Work on Productivity",
-            "url": "https://example.com/remote-work-1",
-            "content": "Long-term studies reveal mixed effects of remote work on employee productivity and well-being. Companies adapt with hybrid models and new management strategies.",
-            "source": "Business Insights"
-        },
-        {
-            "title": "Neuroscience Discoveries About Learning",
-            "url": "https://example.com/neuroscience-1",
-            "content": "Brain imaging studies uncover how neural pathways form during skill acquisition. Findings could improve educational methods and rehabilitation therapies.",
-            "source": "Neuroscience Today"
-        }
-    ]
+    # One idempotent multi-row INSERT; existing URLs hit the unique key and are left as-is
+    upsert = mysql_insert(Article).values(list(_SAMPLE_ARTICLES))
+    db.execute(upsert.on_duplicate_key_update(url=upsert.inserted.url))
+    db.commit()
     
-    created_ids = []
-    
-    for article_data in sample_articles:
-        # Check if article already exists
-        existing = db.query(Article).filter(Article.url == article_data["url"]).first()
-        
-        if not existing:
-            article = Article(**article_data)
-            db.add(article)
-            db.commit()
-            db.refresh(article)
-            created_ids.append(article.id)
-            logger.info(f"Created article: {article.title}")
-        else:
-            created_ids.append(existing.id)
-            logger.info(f"Article already exists: {existing.title}")
+    # One SELECT collects the IDs of new and pre-existing samples alike
+    urls = [article_data["url"] for article_data in _SAMPLE_ARTICLES]
+    ids_by_url = dict(db.query(Article.url, Article.id).filter(Article.url.in_(urls)).all())
+    created_ids = [ids_by_url[url] for url in urls]
+    logger.info(f"Upserted {len(created_ids)} sample articles")
     
     return created_ids
 
 
-def generate_embeddings_for_articles(db: Session):
+def _store_embeddings(db: Session, articles: list) -> int:
     """
-    Generate FAISS embeddings for all articles without embeddings.
+    Embed, index and persist one batch of articles.
     
     Args:
         db: Database session
+        articles: Articles without embeddings
+        
+    Returns:
+        Number of embeddings stored
     """
-    # Get articles without embeddings
-    articles = db.query(Article).outerjoin(FAISSEmbedding).filter(FAISSEmbedding.id == None).all()
-    
-    if not articles:
-        logger.info("No articles need embeddings")
-        return
-    
-    logger.info(f"Generating embeddings for {len(articles)} articles...")
-    
-    # Prepare texts and IDs
-    texts = [article.content for article in articles]
-    article_ids = [article.id for article in articles]
+    # FAISS adds rows in blocks from one contiguous float32 buffer
+    embeddings = np.ascontiguousarray(
+        faiss_service.generate_embeddings_batch([article.content for article in articles]),
+        dtype=np.float32
+    )
+    faiss_service.add_embeddings(embeddings, [article.id for article in articles])
+    
+    # Store the whole batch with one multi-row INSERT
+    # Stored as int8 codes plus a scale, the format unpack_embedding reads back
+    rows = [
+        {"embedding_vector": faiss_service.pack_embedding(embedding), "article_id": article.id}
+        for embedding, article in zip(embeddings, articles)
+    ]
+    db.execute(insert(FAISSEmbedding).values(rows))
+    db.commit()
     
-    # Generate embeddings
-    embeddings = faiss_service.generate_embeddings_batch(texts)
+    return len(rows)
+
+
+def generate_embeddings_for_articles(db: Session) -> Optional[threading.Thread]:
+    """
+    Generate FAISS embeddings for all articles without embeddings.
     
-    # Add to FAISS index
-    faiss_service.add_embeddings(embeddings, article_ids)
+    Articles are processed EMBEDDING_BATCH_SIZE at a time so memory stays
+    bounded by the batch rather than the backlog.
     
-    # Store individual embeddings in database
-    for i, article in enumerate(articles):
-        embedding_bytes = embeddings[i].tobytes()
-        
-        faiss_embedding = FAISSEmbedding(
-            embedding_vector=embedding_bytes,
-            article_id=article.id
-        )
-        
-        db.add(faiss_embedding)
-        db.commit()
-        db.refresh(faiss_embedding)
-        
-        # Update article with embedding_id
-        article.embedding_id = faiss_embedding.id
-        db.commit()
+    Args:
+        db: Database session
         
-        logger.info(f"Stored embedding for article {article.id}")
+    Returns:
+        The thread saving the index to disk (join before exiting), or None
+    """
+    # NOT EXISTS probes the unique article_id index
+    pending = db.query(Article).filter(
+        ~exists().where(FAISSEmbedding.article_id == Article.id)
+    ).order_by(Article.id)
+    
+    total = 0
+    last_id = 0
+    # Batches land in the flat index; any HNSW graph is built once at the end
+    with faiss_service.bulk_load():
+        while True:
+            # Keyset pagination: safe across the per-batch commits, unlike a streamed cursor
+            articles = pending.filter(Article.id > last_id).limit(EMBEDDING_BATCH_SIZE).all()
+            if not articles:
+                break
+            last_id = articles[-1].id
+            total += _store_embeddings(db, articles)
+            db.expunge_all()
+            logger.info(f"Stored {total} embeddings so far")
+    
+    if not total:
+        logger.info("No articles need embeddings")
+        return None
     
-    # Save FAISS index to disk
-    os.makedirs(os.path.dirname(settings.FAISS_INDEX_PATH), exist_ok=True)
-    faiss_service.save_index(settings.FAISS_INDEX_PATH)
+    logger.info(f"Successfully generated and stored {total} embeddings")
     
-    logger.info(f"Successfully generated and stored {len(articles)} embeddings")
+    # Save FAISS index to disk once, after every batch is in. save_index writes a
+    # temp file and renames it, so the write can overlap the rest of setup.
+    os.makedirs(os.path.dirname(settings.FAISS_INDEX_PATH), exist_ok=True)
+    save_thread = threading.Thread(
+        target=faiss_service.save_index, args=(settings.FAISS_INDEX_PATH,), name="faiss-save"
+    )
+    save_thread.start()
+    return save_thread
 
 
 def load_faiss_index_from_disk():
     """Load FAISS index from disk if it exists."""
     if os.path.exists(settings.FAISS_INDEX_PATH):
         logger.info(f"Loading FAISS index from {settings.FAISS_INDEX_PATH}")
-        faiss_service.load_index(settings.FAISS_INDEX_PATH)
+        # Setup adds vectors next, so the index must be loaded writable
+        faiss_service.load_index(settings.FAISS_INDEX_PATH, mmap=False)
         stats = faiss_service.get_index_stats()
         logger.info(f"FAISS index loaded: {stats}")
     else:
@@ -185,6 +153,7 @@ def main():
     
     # Create database session
     db = SessionLocal()
+    save_thread = None
     
     try:
         # Create sample articles
@@ -195,8 +164,8 @@ def main():
         # Try to load existing index
         load_faiss_index_from_disk()
         
-        # Generate embeddings
-        generate_embeddings_for_articles(db)
+        # Generate embeddings; the index is saved in the background
+        save_thread = generate_embeddings_for_articles(db)
         
         # Display final stats
         stats = faiss_service.get_index_stats()
@@ -208,8 +177,13 @@ def main():
         results = faiss_service.search(test_query, top_k=3)
         
         logger.info(f"\nSearch results for '{test_query}':")
+        result_ids = [article_id for article_id, _ in results]
+        articles = {
+            article.id: article
+            for article in db.query(Article).filter(Article.id.in_(result_ids)).all()
+        }
         for article_id, distance in results:
-            article = db.query(Article).filter(Article.id == article_id).first()
+            article = articles.get(article_id)
             if article:
                 logger.info(f"  - {article.title} (distance: {distance:.4f})")
         
@@ -218,6 +192,8 @@ def main():
         raise
     finally:
         db.close()
+        if save_thread is not None:
+            save_thread.join()
     
     logger.info("\nFAISS index setup completed successfully!")
 
@@ -3,35 +3,66 @@ import sys
 import os
 from pathlib import Path
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from loguru import logger
 
 # Base URL for API
 BASE_URL = "http://localhost:8000/api/v1"
 
-def print_test_header(test_name):
+# One keep-alive session for the whole suite instead of a connection per call
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+def _json(response):
+    """Decode a response body with orjson."""
+    return orjson.loads(response.content)
+
+def _post_json(url, payload):
+    """POST a payload serialized with orjson."""
+    return SESSION.post(url, data=orjson.dumps(payload), headers=JSON_HEADERS)
+
+def _buffered(test):
+    """
+    Run a test with its output collected instead of printed.
+    
+    Args:
+        test: Callable taking the output function to use in place of print
+        
+    Returns:
+        Tuple of (test result, collected output)
+    """
+    lines = []
+    result = test(lambda *parts: lines.append(" ".join(str(part) for part in parts)))
+    return result, "\n".join(lines)
+
+def print_test_header(test_name, out=print):
     """Print test section header."""
-    print("\n" + "="*70)
-    print(f"🧪 TEST: {test_name}")
-    print("="*70)
+    out("\n" + "="*70)
+    out(f"🧪 TEST: {test_name}")
+    out("="*70)
 
-def print_result(success, message):
+def print_result(success, message, out=print):
     """Print test result."""
     status = "✅ PASS" if success else "❌ FAIL"
-    print(f"{status}: {message}\n")
+    out(f"{status}: {message}\n")
 
 def test_health_check():
     """Test health check endpoint."""
     print_test_header("Health Check")
     
     try:
-        response = requests.get(f"{BASE_URL}/health")
+        response = SESSION.get(f"{BASE_URL}/health")
         if response.status_code == 200:
-            data = response.json()
+            data = _json(response)
             print(f"Status: {data.get('status')}")
             print(f"FAISS Index: {json.dumps(data.get('faiss_index'), indent=2)}")
             print_result(True, "Health check successful")
@@ -54,10 +85,10 @@ def test_user_signup():
             "reading_level": "intermediate"
         }
         
-        response = requests.post(f"{BASE_URL}/signup", json=user_data)
+        response = _post_json(f"{BASE_URL}/signup", user_data)
         
         if response.status_code in [200, 201]:
-            data = response.json()
+            data = _json(response)
             print(f"Created User ID: {data.get('id')}")
             print(f"Email: {data.get('email')}")
             print(f"Interests: {data.get('interests')}")
@@ -85,10 +116,10 @@ def test_fetch_news(user_id=None):
         if user_id:
             params["user_id"] = user_id
         
-        response = requests.get(f"{BASE_URL}/fetch_news", params=params)
+        response = SESSION.get(f"{BASE_URL}/fetch_news", params=params)
         
         if response.status_code == 200:
-            data = response.json()
+            data = _json(response)
             articles = data.get('articles', [])
             print(f"Fetched {len(articles)} articles")
             
@@ -116,10 +147,10 @@ def test_generate_embeddings(article_ids=None):
         if article_ids:
             data["article_ids"] = article_ids[:5]  # Limit to 5 for testing
         
-        response = requests.post(f"{BASE_URL}/generate_embeddings", json=data)
+        response = _post_json(f"{BASE_URL}/generate_embeddings", data)
         
         if response.status_code == 200:
-            result = response.json()
+            result = _json(response)
             print(f"Status: {result.get('status')}")
             print(f"Message: {result.get('message')}")
             print(f"Embeddings Generated: {result.get('embeddings_generated')}")
@@ -136,9 +167,9 @@ def test_generate_embeddings(article_ids=None):
         print_result(False, f"Generate embeddings error: {e}")
         return False
 
-def test_semantic_search(user_id):
+def test_semantic_search(user_id, out=print):
     """Test semantic search endpoint."""
-    print_test_header("Semantic Search")
+    print_test_header("Semantic Search", out)
     
     try:
         search_data = {
@@ -147,31 +178,31 @@ def test_semantic_search(user_id):
             "top_k": 5
         }
         
-        response = requests.post(f"{BASE_URL}/search_articles", json=search_data)
+        response = _post_json(f"{BASE_URL}/search_articles", search_data)
         
         if response.status_code == 200:
-            data = response.json()
+            data = _json(response)
             articles = data.get('articles', [])
-            print(f"Query: {data.get('query')}")
-            print(f"Found {data.get('total_results')} results\n")
+            out(f"Query: {data.get('query')}")
+            out(f"Found {data.get('total_results')} results\n")
             
             for i, article in enumerate(articles, 1):
-                print(f"  {i}. {article.get('title')}")
-                print(f"     Source: {article.get('source')}")
-                print(f"     ID: {article.get('id')}\n")
+                out(f"  {i}. {article.get('title')}")
+                out(f"     Source: {article.get('source')}")
+                out(f"     ID: {article.get('id')}\n")
             
-            print_result(True, f"Search returned {len(articles)} results")
+            print_result(True, f"Search returned {len(articles)} results", out)
             return articles
         else:
-            print_result(False, f"Search failed: {response.status_code}")
+            print_result(False, f"Search failed: {response.status_code}", out)
             return []
     except Exception as e:
-        print_result(False, f"Search error: {e}")
+        print_result(False, f"Search error: {e}", out)
         return []
 
-def test_summarization():
+def test_summarization(out=print):
     """Test article summarization endpoint."""
-    print_test_header("Article Summarization")
+    print_test_header("Article Summarization", out)
     
     try:
         summarize_data = {
@@ -179,28 +210,28 @@ def test_summarization():
             "reading_level": "beginner"
         }
         
-        response = requests.post(f"{BASE_URL}/summarize", json=summarize_data)
+        response = _post_json(f"{BASE_URL}/summarize", summarize_data)
         
         if response.status_code == 200:
-            data = response.json()
-            print(f"Reading Level: {data.get('reading_level')}")
-            print(f"Word Count: {data.get('word_count')}")
-            print(f"\nSummary Points:")
+            data = _json(response)
+            out(f"Reading Level: {data.get('reading_level')}")
+            out(f"Word Count: {data.get('word_count')}")
+            out(f"\nSummary Points:")
             for i, point in enumerate(data.get('summary', []), 1):
-                print(f"  {i}. {point}")
+                out(f"  {i}. {point}")
             
-            print_result(True, "Summarization successful")
+            print_result(True, "Summarization successful", out)
             return True
         else:
-            print_result(False, f"Summarization failed: {response.status_code}")
+            print_result(False, f"Summarization failed: {response.status_code}", out)
             return False
     except Exception as e:
-        print_result(False, f"Summarization error: {e}")
+        print_result(False, f"Summarization error: {e}", out)
         return False
 
-def test_feedback(user_id, article_id):
+def test_feedback(user_id, article_id, out=print):
     """Test feedback submission endpoint."""
-    print_test_header("Submit Feedback")
+    print_test_header("Submit Feedback", out)
     
     try:
         feedback_data = {
@@ -209,26 +240,26 @@ def test_feedback(user_id, article_id):
             "rating": 5
         }
         
-        response = requests.post(f"{BASE_URL}/feedback", json=feedback_data)
+        response = _post_json(f"{BASE_URL}/feedback", feedback_data)
         
         if response.status_code in [200, 201]:
-            data = response.json()
-            print(f"Feedback ID: {data.get('id')}")
-            print(f"User ID: {data.get('user_id')}")
-            print(f"Article ID: {data.get('article_id')}")
-            print(f"Rating: {data.get('rating')} ⭐")
-            print_result(True, "Feedback submitted successfully")
+            data = _json(response)
+            out(f"Feedback ID: {data.get('id')}")
+            out(f"User ID: {data.get('user_id')}")
+            out(f"Article ID: {data.get('article_id')}")
+            out(f"Rating: {data.get('rating')} ⭐")
+            print_result(True, "Feedback submitted successfully", out)
             return True
         else:
-            print_result(False, f"Feedback failed: {response.status_code}")
+            print_result(False, f"Feedback failed: {response.status_code}", out)
             return False
     except Exception as e:
-        print_result(False, f"Feedback error: {e}")
+        print_result(False, f"Feedback error: {e}", out)
         return False
 
-def test_send_email(user_id, article_ids):
+def test_send_email(user_id, article_ids, out=print):
     """Test email sending endpoint."""
-    print_test_header("Send Newsletter Email")
+    print_test_header("Send Newsletter Email", out)
     
     try:
         email_data = {
@@ -237,23 +268,23 @@ def test_send_email(user_id, article_ids):
             "subject": "Your Test Newsletter"
         }
         
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/send_email",
             params=email_data
         )
         
         if response.status_code == 200:
-            data = response.json()
-            print(f"Status: {data.get('status')}")
-            print(f"Message: {data.get('message')}")
-            print(f"Articles Sent: {data.get('articles_sent')}")
-            print_result(True, "Email sent successfully")
+            data = _json(response)
+            out(f"Status: {data.get('status')}")
+            out(f"Message: {data.get('message')}")
+            out(f"Articles Sent: {data.get('articles_sent')}")
+            print_result(True, "Email sent successfully", out)
             return True
         else:
-            print_result(False, f"Email sending failed: {response.status_code}")
+            print_result(False, f"Email sending failed: {response.status_code}", out)
             return False
     except Exception as e:
-        print_result(False, f"Email sending error: {e}")
+        print_result(False, f"Email sending error: {e}", out)
         return False
 
 def run_all_tests():
@@ -264,10 +295,9 @@ def run_all_tests():
     
     results = {}
     
-    # Test 1: Health Check
+    # Phase 1 (serial): health first, then each step feeds the next
     results['health_check'] = test_health_check()
     
-    # Test 2: User Signup
     user_id = test_user_signup()
     results['user_signup'] = user_id is not None
     
@@ -275,7 +305,6 @@ def run_all_tests():
         print("\n❌ Cannot continue tests without user_id")
         return results
     
-    # Test 3: Fetch News
     article_ids = test_fetch_news(user_id)
     results['fetch_news'] = len(article_ids) > 0
     
@@ -283,23 +312,20 @@ def run_all_tests():
         print("\n⚠️  No articles fetched, using sample articles")
         article_ids = [1, 2, 3]  # Assume sample articles from setup script
     
-    # Test 4: Generate Embeddings
     results['generate_embeddings'] = test_generate_embeddings(article_ids)
     
-    # Test 5: Semantic Search
-    search_results = test_semantic_search(user_id)
-    results['semantic_search'] = len(search_results) > 0
-    
-    # Test 6: Summarization
-    results['summarization'] = test_summarization()
-    
-    # Test 7: Feedback
-    if article_ids:
-        results['feedback'] = test_feedback(user_id, article_ids[0])
-    
-    # Test 8: Send Email
-    if article_ids:
-        results['send_email'] = test_send_email(user_id, article_ids)
+    # Phase 2 (concurrent): independent checks overlap their round-trips. Each
+    # buffers its output, which is printed in order once it finishes.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            'semantic_search': executor.submit(_buffered, lambda out: len(test_semantic_search(user_id, out)) > 0),
+            'summarization': executor.submit(_buffered, test_summarization),
+            'feedback': executor.submit(_buffered, lambda out: test_feedback(user_id, article_ids[0], out)),
+            'send_email': executor.submit(_buffered, lambda out: test_send_email(user_id, article_ids, out)),
+        }
+        for name, future in futures.items():
+            results[name], output = future.result()
+            print(output)
     
     # Summary
     print("\n" + "="*70)
@@ -328,7 +354,7 @@ if __name__ == "__main__":
     
     try:
         # Quick check if server is running
-        response = requests.get("http://localhost:8000/")
+        response = SESSION.get("http://localhost:8000/")
         if response.status_code == 200:
             print("✅ Server is running!\n")
             run_all_tests()
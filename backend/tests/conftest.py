@@ -0,0 +1,6 @@
+"""Shared pytest configuration."""
+import sys
+from pathlib import Path
+
+# Add backend directory to path so tests can import the app package
+sys.path.insert(0, str(Path(__file__).parent.parent))
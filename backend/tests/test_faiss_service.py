@@ -0,0 +1,88 @@
+"""Tests for the FAISS index upgrade path."""
+import faiss
+import numpy as np
+import pytest
+
+from app.services.faiss_service import FAISSService, settings
+
+THRESHOLD = 50
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """FAISS service whose HNSW threshold is low enough to cross in a test."""
+    monkeypatch.setattr(settings, "FAISS_HNSW_THRESHOLD", THRESHOLD)
+    return FAISSService()
+
+
+def _vectors(n: int, dimension: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((n, dimension)).astype(np.float32)
+
+
+def _untrained_hnsw(service: FAISSService, monkeypatch):
+    """Make the HNSW target start untrained, as IndexHNSWSQ does on faiss 1.7.4."""
+    build_index = service._build_index
+    
+    def build(expected_size: int = 0):
+        if expected_size < THRESHOLD:
+            return build_index(expected_size)
+        index = faiss.IndexHNSWSQ(
+            service.dimension, faiss.ScalarQuantizer.QT_8bit, settings.FAISS_HNSW_M, faiss.METRIC_INNER_PRODUCT
+        )
+        assert not index.is_trained
+        return index
+    
+    monkeypatch.setattr(service, "_build_index", build)
+
+
+def _assert_upgraded(service: FAISSService, vectors: np.ndarray):
+    assert hasattr(service.index, "hnsw")
+    assert service.index.is_trained
+    assert service.index.ntotal == len(vectors) == len(service.article_ids)
+    results = service.search_by_embeddings(vectors[:1], top_k=1)
+    assert results[0][0][0] == 0
+
+
+def test_add_embeddings_past_threshold_upgrades_to_trained_hnsw(service, monkeypatch):
+    _untrained_hnsw(service, monkeypatch)
+    vectors = _vectors(THRESHOLD + 10, service.dimension)
+    
+    service.add_embeddings(vectors[:THRESHOLD - 1], list(range(THRESHOLD - 1)))
+    assert not hasattr(service.index, "hnsw")
+    service.add_embeddings(vectors[THRESHOLD - 1:], list(range(THRESHOLD - 1, len(vectors))))
+    
+    _assert_upgraded(service, vectors)
+    # The upgraded index keeps accepting adds
+    extra = _vectors(1, service.dimension)
+    service.add_embeddings(extra, [len(vectors)])
+    assert service.index.ntotal == len(service.article_ids) == len(vectors) + 1
+
+
+def test_failed_upgrade_keeps_live_index(service, monkeypatch):
+    vectors = _vectors(THRESHOLD, service.dimension)
+    service.add_embeddings(vectors[:-1], list(range(THRESHOLD - 1)))
+    live_index = service.index
+    
+    def broken_build(expected_size: int = 0):
+        raise RuntimeError("build failed")
+    
+    monkeypatch.setattr(service, "_build_index", broken_build)
+    with pytest.raises(RuntimeError):
+        service.add_embeddings(vectors[-1:], [THRESHOLD - 1])
+    
+    assert service.index is live_index
+    assert service.index.ntotal == len(service.article_ids) == THRESHOLD
+
+
+def test_bulk_load_trains_hnsw_once_on_exit(service, monkeypatch):
+    _untrained_hnsw(service, monkeypatch)
+    vectors = _vectors(THRESHOLD * 2, service.dimension)
+    
+    with service.bulk_load():
+        for start in range(0, len(vectors), 16):
+            batch = vectors[start:start + 16]
+            service.add_embeddings(batch, list(range(start, start + len(batch))))
+        assert not hasattr(service.index, "hnsw")
+    
+    _assert_upgraded(service, vectors)